@@ -0,0 +1,47 @@
+"""Add unique constraint on user_group_mapper user_id and group_id
+
+Revision ID: 8d2f6a1c4b97
+Revises: 310f4b46a4b2
+Create Date: 2026-10-16 10:12:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d2f6a1c4b97'
+down_revision: Union[str, Sequence[str], None] = '310f4b46a4b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The old check-then-insert path could race and leave duplicate pairs;
+    # keep the lowest id of each (user_id, group_id) so the constraint applies
+    op.execute(
+        """
+        DELETE FROM user_group_mapper AS duplicate
+        USING user_group_mapper AS kept
+        WHERE duplicate.user_id = kept.user_id
+          AND duplicate.group_id = kept.group_id
+          AND duplicate.id > kept.id
+        """
+    )
+    op.create_unique_constraint(
+        'uq_user_group_mapper_user_id_group_id',
+        'user_group_mapper',
+        ['user_id', 'group_id']
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint(
+        'uq_user_group_mapper_user_id_group_id',
+        'user_group_mapper',
+        type_='unique'
+    )
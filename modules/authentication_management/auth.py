@@ -81,7 +81,9 @@ def authenticate_user(email: str, password: str) -> Optional[Dict[str, Any]]:
         hashed_password = _hash_password(password)
 
         with UserManager() as user_manager:
-            user = user_manager.get_user_by_email(normalized_email)
+            # Bypass the process-local cache: another worker may have changed
+            # the password or deactivated the user since it was filled
+            user = user_manager.get_user_by_email(normalized_email, cache=False)
             if (
                 user
                 and user.get("passwd") == hashed_password
@@ -5,10 +5,11 @@ Implements SQLAlchemy and custom exceptions from exceptions.py.
 Features a singleton pattern for shared persistent connections across all database functions.
 """
 
-from sqlalchemy import create_engine, Table, MetaData, select, insert, update, delete, text
+from sqlalchemy import create_engine, Table, MetaData, select, insert, update, delete, text, func, or_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.engine import Engine
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Iterable, Iterator, Tuple, Union
 import threading
 import logging
 
@@ -79,6 +80,7 @@ class PostgresDB:
     _engine = None
     _metadata = None
     _connection_initialized = False
+    _tables: Dict[str, Table] = {}
 
     def __new__(cls):
         """
@@ -129,6 +131,7 @@ class PostgresDB:
                 pool_pre_ping=True,     # Validate connections before use
                 # Performance settings
                 echo=False,             # Set to True for SQL logging in development
+                query_cache_size=1200,  # Compiled statement cache entries (default 500)
                 connect_args={
                     "connect_timeout": 10,
                     "application_name": "tiger_etl_persistent"
@@ -136,6 +139,7 @@ class PostgresDB:
             )
             
             self._metadata = MetaData()
+            self._tables.clear()
             
             # Test the connection
             with self._engine.connect() as conn:
@@ -206,6 +210,50 @@ class PostgresDB:
             logger.error(f"Connection test failed: {e}")
             return False
 
+    def get_table(self, table_name: str) -> Table:
+        """
+        Get the reflected Table object for the specified table.
+
+        Useful for building statements to run inside execute_transaction().
+
+        Args:
+            table_name (str): Table name.
+
+        Returns:
+            Table: Reflected SQLAlchemy table.
+
+        Raises:
+            SQLAlchemyReadError: If the table cannot be reflected.
+
+        Example:
+            >>> db = PostgresDB()
+            >>> users = db.get_table('users')
+            >>> stmt = select(users).where(users.c.id == 1).with_for_update()
+        """
+        try:
+            return self._table(table_name)
+        except SQLAlchemyError as e:
+            raise SQLAlchemyReadError(f"Table reflection failed: {e}")
+
+    def _table(self, table_name: str) -> Table:
+        """
+        Return the reflected Table for ``table_name``, reflecting it only on first use.
+
+        Reflection queries the database catalog, so the result is cached for the
+        lifetime of the engine and cleared by close().
+
+        Args:
+            table_name (str): Table name.
+
+        Returns:
+            Table: Reflected SQLAlchemy table.
+        """
+        table = self._tables.get(table_name)
+        if table is None:
+            table = Table(table_name, self.metadata, autoload_with=self.engine)
+            self._tables[table_name] = table
+        return table
+
     def create(self, table_name: str, data: Dict[str, Any]) -> Optional[Any]:
         """
         Insert a new record into the specified table with transaction support.
@@ -231,7 +279,7 @@ class PostgresDB:
             >>> print(created_user.id)  # Access the created user's ID
         """
         try:
-            table = Table(table_name, self.metadata, autoload_with=self.engine)
+            table = self._table(table_name)
             stmt = insert(table).values(**data).returning(table)
             
             with self.engine.begin() as conn:
@@ -241,6 +289,49 @@ class PostgresDB:
             # Transaction automatically rolled back by the context manager
             raise SQLAlchemyInsertError(f"Insert failed: {e}")
 
+    def create_on_conflict_nothing(self, table_name: str, data: Dict[str, Any], conflict_columns: List[str]) -> Optional[Any]:
+        """
+        Insert a new record unless it conflicts with an existing one, in a single statement.
+
+        Compiles to ``INSERT ... ON CONFLICT (<columns>) DO NOTHING RETURNING *``, so the
+        duplicate check and the insert cannot race with concurrent writers. The conflict
+        columns must be covered by a unique constraint or index.
+
+        Args:
+            table_name (str): Table name.
+            data (dict): Data to insert.
+            conflict_columns (List[str]): Columns of the unique constraint to check.
+
+        Returns:
+            Optional[Any]: The inserted record, or None if a conflicting record exists.
+
+        Raises:
+            SQLAlchemyInsertError: If the insert operation fails.
+
+        Example:
+            >>> db = PostgresDB()
+            >>> created = db.create_on_conflict_nothing(
+            ...     'user_group_mapper', {'user_id': 1, 'group_id': 2}, ['user_id', 'group_id']
+            ... )
+            >>> if created is None:
+            ...     print("Mapping already exists")
+        """
+        try:
+            table = self._table(table_name)
+            stmt = (
+                pg_insert(table)
+                .values(**data)
+                .on_conflict_do_nothing(index_elements=conflict_columns)
+                .returning(table)
+            )
+            
+            with self.engine.begin() as conn:
+                result = conn.execute(stmt)
+                return result.fetchone()
+        except SQLAlchemyError as e:
+            # Transaction automatically rolled back by the context manager
+            raise SQLAlchemyInsertError(f"Insert failed: {e}") from e
+
     def read(self, table_name: str, conditions: Optional[Dict[str, Any]] = None, join: int = 0, limit: Optional[int] = None, offset: int = 0) -> List[Any]:
         """
         Read records from the specified table with optional conditions, join control, and pagination.
@@ -281,7 +372,7 @@ class PostgresDB:
             ...     print(f"Found user: {user[0].username}")
         """
         try:
-            table = Table(table_name, self.metadata, autoload_with=self.engine)
+            table = self._table(table_name)
             
             # Build base select statement
             stmt = select(table)
@@ -308,6 +399,328 @@ class PostgresDB:
         except SQLAlchemyError as e:
             raise SQLAlchemyReadError(f"Read failed: {e}")
 
+    def read_mappings(self, table_name: str, conditions: Optional[Dict[str, Any]] = None, columns: Optional[List[str]] = None, limit: Optional[int] = None, offset: int = 0) -> List[Any]:
+        """
+        Read records as dictionary-like RowMapping views, optionally selecting only some columns.
+
+        The returned RowMapping objects support key access and ``.get()`` without copying
+        each row into a new dict.
+
+        Args:
+            table_name (str): Table name.
+            conditions (dict, optional): Conditions for filtering.
+            columns (List[str], optional): Columns to select (default: all columns).
+            limit (int, optional): Maximum number of records to return.
+            offset (int, optional): Number of records to skip (for pagination).
+
+        Returns:
+            List[Any]: List of RowMapping records.
+
+        Raises:
+            SQLAlchemyReadError: If the read operation fails.
+
+        Example:
+            >>> db = PostgresDB()
+            >>> users = db.read_mappings('users', {'is_active': True}, columns=['id', 'username'])
+            >>> print(users[0]['username'])
+        """
+        try:
+            table = self._table(table_name)
+            
+            if columns:
+                stmt = select(*(table.c[column] for column in columns))
+            else:
+                stmt = select(table)
+            
+            if conditions:
+                for key, value in conditions.items():
+                    stmt = stmt.where(table.c[key] == value)
+            
+            if limit is not None:
+                stmt = stmt.limit(limit)
+            if offset > 0:
+                stmt = stmt.offset(offset)
+            
+            with self.engine.connect() as conn:
+                result = conn.execute(stmt)
+                return result.mappings().all()
+        except SQLAlchemyError as e:
+            raise SQLAlchemyReadError(f"Read failed: {e}")
+
+    def read_page_with_counts(self, table_name: str, conditions: Optional[Dict[str, Any]] = None, limit: Optional[int] = None, offset: int = 0, flag_column: Optional[str] = None) -> Tuple[List[Dict[str, Any]], int, int]:
+        """
+        Read one page of records together with the total (and flagged) count of all matches.
+
+        The counts are computed in the same statement with window aggregates
+        (``COUNT(*) OVER ()`` and ``COUNT(*) FILTER (WHERE <flag>) OVER ()``), so no
+        separate count query is needed unless the page is empty. Rows are ordered by
+        primary key so pages are stable.
+
+        Args:
+            table_name (str): Table name.
+            conditions (dict, optional): Conditions for filtering.
+            limit (int, optional): Maximum number of records to return.
+            offset (int, optional): Number of records to skip (for pagination).
+            flag_column (str, optional): Boolean column whose true values are counted.
+
+        Returns:
+            Tuple[List[Dict[str, Any]], int, int]: The page as dictionaries, the total
+            number of matching records and the number with ``flag_column`` true
+            (0 if no flag column is given).
+
+        Raises:
+            SQLAlchemyReadError: If the read operation fails.
+
+        Example:
+            >>> db = PostgresDB()
+            >>> users, total, active = db.read_page_with_counts(
+            ...     'users', limit=10, offset=20, flag_column='is_active'
+            ... )
+        """
+        try:
+            table = self._table(table_name)
+            column_names = table.c.keys()
+            
+            count_columns = [func.count().over().label('_total_count')]
+            if flag_column:
+                count_columns.append(
+                    func.count().filter(table.c[flag_column].is_(True)).over().label('_flagged_count')
+                )
+            
+            stmt = select(table, *count_columns).order_by(*table.primary_key.columns)
+            
+            if conditions:
+                for key, value in conditions.items():
+                    stmt = stmt.where(table.c[key] == value)
+            
+            if limit is not None:
+                stmt = stmt.limit(limit)
+            if offset > 0:
+                stmt = stmt.offset(offset)
+            
+            with self.engine.connect() as conn:
+                rows = conn.execute(stmt).mappings().all()
+        except SQLAlchemyError as e:
+            raise SQLAlchemyReadError(f"Read failed: {e}")
+        
+        if not rows:
+            # An empty page carries no window values; fall back to a plain count
+            if not offset:
+                return [], 0, 0
+            if flag_column:
+                total, flagged = self.count(table_name, conditions, flag_column=flag_column)
+                return [], total, flagged
+            return [], self.count(table_name, conditions), 0
+        
+        first_row = rows[0]
+        total = first_row['_total_count']
+        flagged = first_row['_flagged_count'] if flag_column else 0
+        records = [{name: row[name] for name in column_names} for row in rows]
+        return records, total, flagged
+
+    def search(self, table_name: str, term: str, search_columns: Iterable[str], limit: Optional[int] = None, offset: int = 0) -> List[Any]:
+        """
+        Read records where any of the given columns contains ``term``, case-insensitively.
+
+        The match and the pagination both run in the database, so only the requested
+        page of rows is transferred. Rows are returned as dictionary-like RowMapping
+        views, as in read_mappings().
+
+        Args:
+            table_name (str): Table name.
+            term (str): Substring to look for; LIKE wildcards in it are matched literally.
+            search_columns (Iterable[str]): Text columns to search in.
+            limit (int, optional): Maximum number of records to return.
+            offset (int, optional): Number of records to skip (for pagination).
+
+        Returns:
+            List[Any]: List of matching RowMapping records.
+
+        Raises:
+            SQLAlchemyReadError: If the read operation fails.
+
+        Example:
+            >>> db = PostgresDB()
+            >>> johns = db.search('users', 'john', ['username', 'first_name'], limit=10)
+            >>> print(johns[0]['username'])
+        """
+        try:
+            table = self._table(table_name)
+            stmt = select(table).where(self._search_clause(table, term, search_columns))
+            
+            if limit is not None:
+                stmt = stmt.limit(limit)
+            if offset > 0:
+                stmt = stmt.offset(offset)
+            
+            with self.engine.connect() as conn:
+                result = conn.execute(stmt)
+                return result.mappings().all()
+        except SQLAlchemyError as e:
+            raise SQLAlchemyReadError(f"Search failed: {e}")
+
+    def count_search(self, table_name: str, term: str, search_columns: Iterable[str]) -> int:
+        """
+        Count records where any of the given columns contains ``term``, case-insensitively.
+
+        Args:
+            table_name (str): Table name.
+            term (str): Substring to look for; LIKE wildcards in it are matched literally.
+            search_columns (Iterable[str]): Text columns to search in.
+
+        Returns:
+            int: Number of matching records.
+
+        Raises:
+            SQLAlchemyReadError: If the count operation fails.
+
+        Example:
+            >>> db = PostgresDB()
+            >>> total = db.count_search('users', 'john', ['username', 'first_name'])
+        """
+        try:
+            table = self._table(table_name)
+            stmt = (
+                select(func.count())
+                .select_from(table)
+                .where(self._search_clause(table, term, search_columns))
+            )
+            
+            with self.engine.connect() as conn:
+                return conn.execute(stmt).scalar_one()
+        except SQLAlchemyError as e:
+            raise SQLAlchemyReadError(f"Count failed: {e}")
+
+    @staticmethod
+    def _search_clause(table: Table, term: str, search_columns: Iterable[str]):
+        """
+        Build an OR of case-insensitive "contains" tests, one per column, with the term autoescaped.
+        """
+        return or_(*(table.c[column].icontains(term, autoescape=True) for column in search_columns))
+
+    def read_in(self, table_name: str, column: str, values: Iterable[Any], columns: Optional[List[str]] = None) -> List[Any]:
+        """
+        Read records whose column value is one of the given values in a single query.
+
+        Args:
+            table_name (str): Table name.
+            column (str): Column to match against.
+            values (Iterable[Any]): Values to match (compiled as an expanding IN list).
+            columns (List[str], optional): Columns to select (default: all columns).
+
+        Returns:
+            List[Any]: List of matching records (empty if no values are given).
+
+        Raises:
+            SQLAlchemyReadError: If the read operation fails.
+
+        Example:
+            >>> db = PostgresDB()
+            >>> users = db.read_in('users', 'id', [1, 2, 3])
+            >>> user_ids = db.read_in('users', 'id', [1, 2, 3], columns=['id'])
+        """
+        values = list(values)
+        if not values:
+            return []
+        
+        try:
+            table = self._table(table_name)
+            if columns:
+                stmt = select(*(table.c[name] for name in columns))
+            else:
+                stmt = select(table)
+            stmt = stmt.where(table.c[column].in_(values))
+            
+            with self.engine.connect() as conn:
+                result = conn.execute(stmt)
+                return result.fetchall()
+        except SQLAlchemyError as e:
+            raise SQLAlchemyReadError(f"Read failed: {e}")
+
+    def read_stream(self, table_name: str, conditions: Optional[Dict[str, Any]] = None, batch_size: int = 1000) -> Iterator[Any]:
+        """
+        Stream records from the specified table through a server-side cursor.
+
+        Rows are pulled from the database in batches of ``batch_size`` instead of being
+        materialized all at once, so memory use stays bounded regardless of table size.
+
+        Args:
+            table_name (str): Table name.
+            conditions (dict, optional): Conditions for filtering.
+            batch_size (int, optional): Number of rows fetched per round-trip (default: 1000).
+
+        Yields:
+            Any: Records one at a time.
+
+        Raises:
+            SQLAlchemyReadError: If the read operation fails.
+
+        Example:
+            >>> db = PostgresDB()
+            >>> for user in db.read_stream('users', {'is_active': True}):
+            ...     print(user.username)
+        """
+        try:
+            table = self._table(table_name)
+            
+            stmt = select(table)
+            if conditions:
+                for key, value in conditions.items():
+                    stmt = stmt.where(table.c[key] == value)
+            
+            with self.engine.connect() as conn:
+                result = conn.execution_options(stream_results=True, yield_per=batch_size).execute(stmt)
+                for partition in result.partitions():
+                    yield from partition
+        except SQLAlchemyError as e:
+            raise SQLAlchemyReadError(f"Streaming read failed: {e}")
+
+    def count(self, table_name: str, conditions: Optional[Dict[str, Any]] = None, flag_column: Optional[str] = None) -> Union[int, Tuple[int, int]]:
+        """
+        Count records in the specified table with SELECT COUNT(*).
+
+        Args:
+            table_name (str): Table name.
+            conditions (dict, optional): Conditions for filtering.
+            flag_column (str, optional): Boolean column to additionally count the true
+                values of, using COUNT(*) FILTER (WHERE <column>) in the same query.
+
+        Returns:
+            Union[int, Tuple[int, int]]: Number of matching records, or a
+            ``(total, flagged)`` tuple when ``flag_column`` is given.
+
+        Raises:
+            SQLAlchemyReadError: If the count operation fails.
+
+        Examples:
+            >>> db = PostgresDB()
+            >>> total_users = db.count('users')
+            >>> total, active = db.count('users', {'role': 'admin'}, flag_column='is_active')
+        """
+        try:
+            table = self._table(table_name)
+            
+            if flag_column:
+                stmt = select(
+                    func.count(),
+                    func.count().filter(table.c[flag_column].is_(True))
+                ).select_from(table)
+            else:
+                stmt = select(func.count()).select_from(table)
+            
+            if conditions:
+                for key, value in conditions.items():
+                    stmt = stmt.where(table.c[key] == value)
+            
+            with self.engine.connect() as conn:
+                result = conn.execute(stmt)
+                if flag_column:
+                    total, flagged = result.one()
+                    return total, flagged
+                return result.scalar_one()
+        except SQLAlchemyError as e:
+            raise SQLAlchemyReadError(f"Count failed: {e}")
+
     def update(self, table_name: str, data: Dict[str, Any], conditions: Dict[str, Any]) -> List[Any]:
         """
         Update records in the specified table based on conditions with transaction support.
@@ -341,7 +754,7 @@ class PostgresDB:
             >>> print(f"Updated {len(deactivated_users)} users")
         """
         try:
-            table = Table(table_name, self.metadata, autoload_with=self.engine)
+            table = self._table(table_name)
             stmt = update(table).values(**data)
             for key, value in conditions.items():
                 stmt = stmt.where(table.c[key] == value)
@@ -354,16 +767,19 @@ class PostgresDB:
             # Transaction automatically rolled back by the context manager
             raise SQLAlchemyUpdateError(f"Update failed: {e}")
 
-    def delete(self, table_name: str, conditions: Dict[str, Any]) -> int:
+    def delete(self, table_name: str, conditions: Dict[str, Any], returning: bool = False) -> Union[int, List[Any]]:
         """
         Delete records from the specified table based on conditions with transaction support.
 
         Args:
             table_name (str): Table name.
             conditions (dict): Conditions for deletion.
+            returning (bool, optional): If True, return the deleted rows via RETURNING
+                instead of the row count (default: False).
 
         Returns:
-            int: Number of deleted records.
+            Union[int, List[Any]]: Number of deleted records, or the deleted records
+            when ``returning`` is True.
 
         Raises:
             SQLAlchemyDeleteError: If the delete operation fails.
@@ -383,20 +799,72 @@ class PostgresDB:
             ...     'role': 'temp_user',
             ...     'created_date': '2024-01-01'
             ... })
+            >>> 
+            >>> # Delete and get the removed rows back in the same round-trip
+            >>> deleted_rows = db.delete('users', {'is_active': False}, returning=True)
         """
         try:
-            table = Table(table_name, self.metadata, autoload_with=self.engine)
+            table = self._table(table_name)
             stmt = delete(table)
             for key, value in conditions.items():
                 stmt = stmt.where(table.c[key] == value)
+            if returning:
+                stmt = stmt.returning(*table.c)
             
             with self.engine.begin() as conn:
                 result = conn.execute(stmt)
+                if returning:
+                    return result.fetchall()
                 return result.rowcount
         except SQLAlchemyError as e:
             # Transaction automatically rolled back by the context manager
             raise SQLAlchemyDeleteError(f"Delete failed: {e}")
 
+    def delete_in(self, table_name: str, column: str, values: Iterable[Any], returning_columns: Optional[List[str]] = None) -> List[Any]:
+        """
+        Delete records whose column value is one of the given values in a single statement.
+
+        Compiles to ``DELETE ... WHERE <column> IN (...) RETURNING <column>``, so callers
+        learn which values matched without a separate existence check.
+
+        Args:
+            table_name (str): Table name.
+            column (str): Column to match against.
+            values (Iterable[Any]): Values to match (compiled as an expanding IN list).
+            returning_columns (List[str], optional): Columns to return for each deleted
+                record instead of just ``column``.
+
+        Returns:
+            List[Any]: Column values of the deleted records, or records holding
+            ``returning_columns`` when given (empty if no values are given).
+
+        Raises:
+            SQLAlchemyDeleteError: If the delete operation fails.
+
+        Example:
+            >>> db = PostgresDB()
+            >>> deleted_ids = db.delete_in('users', 'id', [1, 2, 3])
+            >>> missing_ids = {1, 2, 3} - set(deleted_ids)
+            >>> deleted = db.delete_in('users', 'id', [4, 5], returning_columns=['id', 'username'])
+        """
+        values = list(values)
+        if not values:
+            return []
+        
+        try:
+            table = self._table(table_name)
+            stmt = delete(table).where(table.c[column].in_(values))
+            
+            with self.engine.begin() as conn:
+                if returning_columns:
+                    stmt = stmt.returning(*(table.c[name] for name in returning_columns))
+                    return conn.execute(stmt).fetchall()
+                result = conn.execute(stmt.returning(table.c[column]))
+                return result.scalars().all()
+        except SQLAlchemyError as e:
+            # Transaction automatically rolled back by the context manager
+            raise SQLAlchemyDeleteError(f"Delete failed: {e}")
+
     def truncate_and_reset_identity(self, table_name: str, cascade: bool = True) -> None:
         """
         Truncate the specified table and reset its identity/auto-increment counter with transaction support.
@@ -472,7 +940,7 @@ class PostgresDB:
                 return results
         except SQLAlchemyError as e:
             # Transaction automatically rolled back by the context manager
-            raise SQLAlchemyError(f"Transaction failed and was rolled back: {e}")
+            raise SQLAlchemyError(f"Transaction failed and was rolled back: {e}") from e
 
     def bulk_create(self, table_name: str, data_list: List[Dict[str, Any]]) -> List[Any]:
         """
@@ -502,7 +970,7 @@ class PostgresDB:
             return []
 
         try:
-            table = Table(table_name, self.metadata, autoload_with=self.engine)
+            table = self._table(table_name)
             results = []
             
             with self.engine.begin() as conn:
@@ -515,6 +983,59 @@ class PostgresDB:
             # Transaction automatically rolled back by the context manager
             raise SQLAlchemyInsertError(f"Bulk insert failed: {e}")
 
+    def bulk_create_on_conflict_nothing(self, table_name: str, data_list: List[Dict[str, Any]], conflict_columns: List[str]) -> List[Any]:
+        """
+        Insert multiple records with multi-row VALUES, skipping rows that conflict.
+
+        Compiles to ``INSERT ... VALUES (...), (...) ON CONFLICT (<columns>) DO NOTHING
+        RETURNING *``. Rows are grouped by their set of keys, so records with the same
+        shape are sent in a single statement; all groups share one transaction.
+
+        Args:
+            table_name (str): Table name.
+            data_list (List[Dict[str, Any]]): List of dictionaries containing data to insert.
+            conflict_columns (List[str]): Columns of the unique constraint to check.
+
+        Returns:
+            List[Any]: List of inserted records (conflicting rows are omitted).
+
+        Raises:
+            SQLAlchemyInsertError: If the bulk insert operation fails.
+
+        Example:
+            >>> db = PostgresDB()
+            >>> created = db.bulk_create_on_conflict_nothing(
+            ...     'user_group_mapper',
+            ...     [{'user_id': 1, 'group_id': 2}, {'user_id': 3, 'group_id': 2}],
+            ...     ['user_id', 'group_id']
+            ... )
+        """
+        if not data_list:
+            return []
+
+        # Multi-row VALUES needs every row to carry the same columns
+        rows_by_shape: Dict[frozenset, List[Dict[str, Any]]] = {}
+        for data in data_list:
+            rows_by_shape.setdefault(frozenset(data), []).append(data)
+
+        try:
+            table = self._table(table_name)
+            results = []
+            
+            with self.engine.begin() as conn:
+                for rows in rows_by_shape.values():
+                    stmt = (
+                        pg_insert(table)
+                        .values(rows)
+                        .on_conflict_do_nothing(index_elements=conflict_columns)
+                        .returning(table)
+                    )
+                    results.extend(conn.execute(stmt).fetchall())
+                return results
+        except SQLAlchemyError as e:
+            # Transaction automatically rolled back by the context manager
+            raise SQLAlchemyInsertError(f"Bulk insert failed: {e}")
+
     def execute_raw_sql(self, sql_query: str, parameters: Optional[Dict[str, Any]] = None, 
                        fetch_results: bool = True, use_transaction: bool = False) -> Optional[List[Any]]:
         """
@@ -628,6 +1149,7 @@ class PostgresDB:
             self._engine.dispose()
             self._engine = None
             self._metadata = None
+            self._tables.clear()
             with self._lock:
                 self._connection_initialized = False
 
@@ -4,6 +4,8 @@ This module contains custom exceptions for database operations
 in the database_functions package.
 """
 
+from typing import Any, Optional
+
 
 class DatabaseFunctionError(Exception):
     """Base exception for database function operations."""
@@ -21,8 +23,32 @@ class UserGroupDeleteError(UserGroupManagementError):
 
 
 class UserGroupValidationError(UserGroupManagementError):
-    """Raised when user group validation fails."""
-    pass
+    """Raised when user group validation fails.
+
+    When wrapping a Pydantic ``ValidationError``, pass it as
+    ``validation_error``: the per-field details are then only formatted into
+    the message when the exception is rendered, and callers can read the raw
+    errors from ``validation_error.errors()``.
+    """
+
+    def __init__(self, message: str, validation_error: Optional[Any] = None) -> None:
+        super().__init__(message)
+        self.validation_error = validation_error
+
+    def __str__(self) -> str:
+        message = super().__str__()
+        if self.validation_error is None:
+            return message
+        details = []
+        for error in self.validation_error.errors():
+            loc = error['loc']
+            # Most errors point at a single top-level field name
+            if len(loc) == 1 and isinstance(loc[0], str):
+                field = loc[0]
+            else:
+                field = ' -> '.join(map(str, loc))
+            details.append(f"{field}: {error['msg']}")
+        return message + "; ".join(details)
 
 
 class UserGroupMapperError(UserGroupManagementError):
@@ -264,8 +264,8 @@ class SessionUpdate(BaseModel):
     @model_validator(mode='after')
     def validate_at_least_one_field(self):
         """Ensure at least one field is provided for update."""
-        provided_fields = {k: v for k, v in self.__dict__.items() if v is not None}
-        if not provided_fields:
+        # Stops at the first provided field instead of building a dict of them
+        if all(value is None for value in self.__dict__.values()):
             raise ValueError("At least one field must be provided for update")
         return self
     
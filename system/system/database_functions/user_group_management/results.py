@@ -0,0 +1,353 @@
+"""Result objects for user-group mapping operations.
+
+This module contains lightweight, immutable result types returned by the
+user-group mapping CRUD functions. Each result is a single slotted object
+instead of a nested dictionary; ``to_dict()`` produces the plain dictionary
+shape for API boundaries and callers that need JSON-serialisable output.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from system.system.database_functions.user_group_management.user_group_management_constants import (
+    MAPPING_CREATED_MESSAGE,
+    MAPPING_UPDATED_MESSAGE,
+    MAPPING_DELETED_MESSAGE,
+)
+
+
+@dataclass(slots=True, frozen=True)
+class MappingCreateResult:
+    """Result of creating a user-group mapping.
+
+    Attributes:
+        mapping: Created mapping record
+        success: Whether the operation succeeded
+    """
+
+    mapping: Dict[str, Any]
+    success: bool = True
+
+    @property
+    def message(self) -> str:
+        """Human-readable summary, built only when requested."""
+        return MAPPING_CREATED_MESSAGE.format(
+            user_id=self.mapping['user_id'], group_id=self.mapping['group_id']
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the result to its dictionary representation.
+
+        Returns:
+            Dict[str, Any]: Result with operation summary and message
+        """
+        mapping = self.mapping
+        return {
+            'success': self.success,
+            'mapping': mapping,
+            'operation_summary': {
+                'mapping_id': mapping['id'],
+                'user_id': mapping['user_id'],
+                'group_id': mapping['group_id'],
+                'is_active': mapping.get('is_active', True),
+                'created_at': str(mapping.get('created_on'))
+            },
+            'message': self.message
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class MappingReadResult:
+    """Result of reading a single user-group mapping.
+
+    Attributes:
+        mapping: Mapping record
+        group_info: Name, description and status of the mapped group
+        success: Whether the operation succeeded
+    """
+
+    mapping: Dict[str, Any]
+    group_info: Dict[str, Any]
+    success: bool = True
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the result to its dictionary representation.
+
+        Returns:
+            Dict[str, Any]: Result with mapping metadata
+        """
+        mapping = self.mapping
+        return {
+            'success': self.success,
+            'mapping': mapping,
+            'group_info': self.group_info,
+            'metadata': {
+                'is_active': mapping.get('is_active', True),
+                'created_at': str(mapping.get('created_on')),
+                'updated_at': str(mapping.get('updated_on')),
+                'has_notes': bool(mapping.get('notes'))
+            }
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class MappingListResult:
+    """Result of reading a page of user-group mappings.
+
+    Attributes:
+        mappings: Mapping records enriched with group name and description
+        total_count: Number of mappings matching the filters
+        active_count: Number of matching mappings that are active
+        limit: Page size requested
+        offset: Number of records skipped
+        success: Whether the operation succeeded
+    """
+
+    mappings: List[Dict[str, Any]]
+    total_count: int
+    active_count: int
+    limit: Optional[int]
+    offset: int
+    success: bool = True
+
+    @property
+    def returned_count(self) -> int:
+        """Number of mappings in this page."""
+        return len(self.mappings)
+
+    @property
+    def inactive_count(self) -> int:
+        """Number of matching mappings that are inactive."""
+        return self.total_count - self.active_count
+
+    @property
+    def has_more(self) -> bool:
+        """Whether more mappings exist beyond this page."""
+        return bool(self.limit) and (self.offset + len(self.mappings)) < self.total_count
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the result to its dictionary representation.
+
+        Returns:
+            Dict[str, Any]: Result with pagination metadata
+        """
+        return {
+            'success': self.success,
+            'mappings': self.mappings,
+            'metadata': {
+                'total_count': self.total_count,
+                'returned_count': self.returned_count,
+                'limit': self.limit,
+                'offset': self.offset,
+                'has_more': self.has_more,
+                'active_count': self.active_count,
+                'inactive_count': self.inactive_count
+            }
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class MappingUpdateResult:
+    """Result of updating a user-group mapping.
+
+    Attributes:
+        mapping: Updated mapping record
+        changes: Validated fields that were written
+        was_active: Mapping status before the update
+        success: Whether the operation succeeded
+    """
+
+    mapping: Dict[str, Any]
+    changes: Dict[str, Any]
+    was_active: Optional[bool]
+    success: bool = True
+
+    @property
+    def message(self) -> str:
+        """Human-readable summary, built only when requested."""
+        return MAPPING_UPDATED_MESSAGE.format(
+            user_id=self.mapping['user_id'], group_id=self.mapping['group_id']
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the result to its dictionary representation.
+
+        Returns:
+            Dict[str, Any]: Result with operation summary and message
+        """
+        mapping = self.mapping
+        return {
+            'success': self.success,
+            'mapping': mapping,
+            'changes': self.changes,
+            'operation_summary': {
+                'mapping_id': mapping['id'],
+                'user_id': mapping['user_id'],
+                'group_id': mapping['group_id'],
+                'fields_updated': list(self.changes.keys()),
+                'updated_at': str(mapping.get('updated_on')),
+                'was_active': self.was_active,
+                'now_active': mapping.get('is_active')
+            },
+            'message': self.message
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class MappingDeleteResult:
+    """Result of deleting a user-group mapping.
+
+    Attributes:
+        deleted_mapping: Deleted mapping record
+        group_name: Name of the group the mapping pointed to
+        success: Whether the operation succeeded
+    """
+
+    deleted_mapping: Dict[str, Any]
+    group_name: str
+    success: bool = True
+
+    @property
+    def message(self) -> str:
+        """Human-readable summary, built only when requested."""
+        return MAPPING_DELETED_MESSAGE.format(
+            user_id=self.deleted_mapping['user_id'], group_name=self.group_name
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the result to its dictionary representation.
+
+        Returns:
+            Dict[str, Any]: Result with operation summary and message
+        """
+        mapping = self.deleted_mapping
+        return {
+            'success': self.success,
+            'deleted_mapping': mapping,
+            'operation_summary': {
+                'mapping_id': mapping['id'],
+                'user_id': mapping['user_id'],
+                'group_id': mapping['group_id'],
+                'group_name': self.group_name,
+                'was_active': mapping.get('is_active', True),
+                'deleted_at': str(mapping.get('updated_on', mapping.get('created_on')))
+            },
+            'message': self.message
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class BulkMappingCreateResult:
+    """Result of creating user-group mappings in batch.
+
+    Per-row outcomes are kept as tuples and only expanded into dictionaries
+    by ``to_dict()``.
+
+    Attributes:
+        created: (index, mapping record) for each created mapping
+        skipped: (index, user_id, group_id) for each pair that already existed
+        errors: Per-row error dictionaries
+        failed_pairs: (user_id, group_id) of each failed row
+        total_processed: Number of mappings submitted
+    """
+
+    created: List[Tuple[int, Dict[str, Any]]]
+    skipped: List[Tuple[int, int, int]]
+    errors: List[Dict[str, Any]]
+    failed_pairs: List[Tuple[int, int]]
+    total_processed: int
+
+    @property
+    def success(self) -> bool:
+        """Whether every row was created or skipped without error."""
+        return not self.errors
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the result to its dictionary representation.
+
+        Returns:
+            Dict[str, Any]: Summary of the bulk creation operation
+        """
+        created_pairs = [(mapping['user_id'], mapping['group_id']) for _, mapping in self.created]
+        return {
+            'success': self.success,
+            'total_processed': self.total_processed,
+            'successful_creations': len(self.created),
+            'failed_creations': len(self.errors),
+            'skipped_duplicates': len(self.skipped),
+            'results': [
+                {
+                    'index': index,
+                    'success': True,
+                    'mapping': mapping,
+                    'user_id': user_id,
+                    'group_id': group_id
+                }
+                for (index, mapping), (user_id, group_id) in zip(self.created, created_pairs)
+            ],
+            'errors': self.errors,
+            'skipped': [
+                {
+                    'index': index,
+                    'user_id': user_id,
+                    'group_id': group_id,
+                    'reason': 'Mapping already exists'
+                }
+                for index, user_id, group_id in self.skipped
+            ],
+            'summary': {
+                'success_rate': (
+                    len(self.created) / self.total_processed * 100 if self.total_processed else 0
+                ),
+                'created_mappings': created_pairs,
+                'failed_mappings': self.failed_pairs
+            }
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class BulkMappingUpdateResult:
+    """Result of updating user-group mappings in batch.
+
+    Attributes:
+        updated: Result of each successful update
+        errors: Per-item error dictionaries
+        failed_ids: Mapping IDs of the failed items
+        total_processed: Number of updates submitted
+    """
+
+    updated: List[MappingUpdateResult]
+    errors: List[Dict[str, Any]]
+    failed_ids: List[Any]
+    total_processed: int
+
+    @property
+    def success(self) -> bool:
+        """Whether every update was applied."""
+        return not self.errors
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the result to its dictionary representation.
+
+        Returns:
+            Dict[str, Any]: Summary of the bulk update operation
+        """
+        updated_ids = [result.mapping['id'] for result in self.updated]
+        return {
+            'success': self.success,
+            'total_processed': self.total_processed,
+            'successful_updates': len(self.updated),
+            'failed_updates': len(self.errors),
+            'results': [
+                {'mapping_id': mapping_id, 'success': True, 'result': result.to_dict()}
+                for mapping_id, result in zip(updated_ids, self.updated)
+            ],
+            'errors': self.errors,
+            'summary': {
+                'success_rate': (
+                    len(self.updated) / self.total_processed * 100 if self.total_processed else 0
+                ),
+                'mappings_updated': updated_ids,
+                'mappings_failed': self.failed_ids
+            }
+        }
@@ -33,11 +33,19 @@ Example:
     ...     print(f"Found {len(groups['groups'])} groups")
 """
 
+import functools
+import heapq
+import itertools
 import logging
-from typing import Dict, Any, List, Tuple, Optional
-from contextlib import contextmanager
-
-from sqlalchemy.orm import Session
+import operator
+from typing import Dict, Any, Iterable, Iterator, List, Tuple, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+
+from sqlalchemy import select, update, delete
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from system.system.database_connections.pg_db import get_session, PostgresDB
 from system.system.database_connections.exceptions import (
     SQLAlchemyDeleteError,
@@ -54,6 +62,7 @@ from system.system.database_functions.exceptions import (
     UserGroupUpdateError,
 )
 from system.system.database_functions.user_group_management.validations import (
+    DEFAULT_SEARCH_FIELDS,
     validate_group_create_data,
     validate_group_update_data,
     validate_group_filters,
@@ -62,14 +71,27 @@ from system.system.database_functions.user_group_management.validations import (
     validate_mapping_create_data,
     validate_mapping_update_data,
     validate_bulk_mapping_create_data,
+    validate_bulk_group_update_data,
     validate_user_group_activation,
     validate_positive_integer,
 )
 from system.system.database_functions.user_group_management.user_group_management_constants import (
     USER_GROUPS_TABLE,
     USER_GROUP_MAPPER_TABLE,
+    USERS_TABLE,
+    BATCH_SUMMARY_MAX_WORKERS,
     MAPPING_ID_POSITIVE_ERROR,
     MAPPING_ID_INTEGER_ERROR,
+    PG_FOREIGN_KEY_VIOLATION,
+)
+from system.system.database_functions.user_group_management.results import (
+    MappingCreateResult,
+    MappingReadResult,
+    MappingListResult,
+    MappingUpdateResult,
+    MappingDeleteResult,
+    BulkMappingCreateResult,
+    BulkMappingUpdateResult,
 )
 
 # Set up logging
@@ -817,26 +839,42 @@ class UserGroupManager:
 # Backward compatibility functions - delegates to UserGroupManager class
 # These functions maintain the existing functional API while using the new OOP implementation
 
+# Group records looked up by check_group_exists, scoped to the outermost
+# get_db_connection() block so repeated lookups of one group hit the DB once
+_group_cache: ContextVar[Optional[Dict[int, Dict[str, Any]]]] = ContextVar('_group_cache', default=None)
+
 
 @contextmanager
 def get_db_connection():
-    """Context manager for SQLAlchemy session with automatic cleanup.
+    """Context manager for the shared, pooled database instance.
 
     Yields:
-        Session: SQLAlchemy session instance
+        PostgresDB: The process-wide PostgresDB singleton
 
     Ensures:
-        Session is properly closed even if an exception occurs
+        Connections come from the engine's pool and every PostgresDB
+        operation runs in its own transaction, so nothing is opened, committed
+        or disposed per call. Multi-statement work that must be atomic goes
+        through ``db.execute_transaction``.
     """
-    session: Session = get_session()
+    db: PostgresDB = get_session()
+    cache_token = _group_cache.set({}) if _group_cache.get() is None else None
     try:
-        yield session
-        session.commit()
-    except Exception:
-        session.rollback()
-        raise
+        yield db
     finally:
-        session.close()
+        if cache_token is not None:
+            _group_cache.reset(cache_token)
+
+
+def _forget_cached_group(group_id: int) -> None:
+    """Drop a group from the current block's group cache, if one is active.
+    
+    Args:
+        group_id: ID of a group that no longer exists
+    """
+    cache = _group_cache.get()
+    if cache is not None:
+        cache.pop(group_id, None)
 
 
 def validate_group_id(group_id: Any) -> int:
@@ -879,6 +917,10 @@ def check_group_exists(db_instance: Any, group_id: int) -> Dict[str, Any]:
         UserGroupNotFoundError: If group doesn't exist
         UserGroupValidationError: If validation fails
     """
+    cache = _group_cache.get()
+    if cache is not None and group_id in cache:
+        return dict(cache[group_id])
+    
     try:
         # Read the group record with optimized query
         group_records = db_instance.read(
@@ -894,12 +936,71 @@ def check_group_exists(db_instance: Any, group_id: int) -> Dict[str, Any]:
         group_record = dict(group_records[0]._mapping)
         logger.debug(f"Found user group: {group_record['group_name']} (ID: {group_id})")
         
+        if cache is not None:
+            cache[group_id] = group_record
+            return dict(group_record)
+        
         return group_record
         
     except SQLAlchemyReadError as e:
         raise UserGroupValidationError(f"Failed to validate group existence: {e}") from e
 
 
+def _read_group_with_mappings(db_instance: PostgresDB, group_id: int,
+                              include_inactive: bool) -> Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Read a group and its mappings with one LEFT JOIN query.
+    
+    Args:
+        db_instance: PostgresDB instance
+        group_id: The group ID
+        include_inactive: Whether to include inactive mappings
+        
+    Returns:
+        Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]]]: The group record
+        (None if the group doesn't exist) and its mappings ordered by ID
+        
+    Raises:
+        UserGroupValidationError: If the query fails
+    """
+    groups_table = db_instance.get_table(USER_GROUPS_TABLE)
+    mapper_table = db_instance.get_table(USER_GROUP_MAPPER_TABLE)
+    
+    # The status filter belongs in the ON clause so a group without matching
+    # mappings still comes back as one row
+    join_condition = mapper_table.c.group_id == groups_table.c.id
+    if not include_inactive:
+        join_condition = join_condition & mapper_table.c.is_active.is_(True)
+    
+    mapper_labels = [column.label(f'mapping_{column.name}') for column in mapper_table.c]
+    stmt = (
+        select(groups_table, *mapper_labels)
+        .select_from(groups_table.outerjoin(mapper_table, join_condition))
+        .where(groups_table.c.id == group_id)
+        .order_by(mapper_table.c.id)
+    )
+    
+    try:
+        [rows] = db_instance.execute_transaction([lambda conn: conn.execute(stmt).mappings().all()])
+    except SQLAlchemyError as e:
+        raise UserGroupValidationError(f"Failed to read group mappings: {e}") from e
+    
+    if not rows:
+        return None, []
+    
+    first_row = rows[0]
+    group_record = {column.name: first_row[column.name] for column in groups_table.c}
+    
+    mappings = []
+    if first_row['mapping_id'] is not None:
+        for row in rows:
+            mapping = {column.name: row[label.name] for column, label in zip(mapper_table.c, mapper_labels)}
+            mapping['group_name'] = group_record['group_name']
+            mapping['group_description'] = group_record.get('description')
+            mappings.append(mapping)
+    
+    return group_record, mappings
+
+
 def get_group_mappings(db_instance: PostgresDB, group_id: int) -> List[Dict[str, Any]]:
     """Get all user mappings for a group with optimized query.
     
@@ -1242,6 +1343,11 @@ def update_user_group(group_id: Any, update_data: Dict[str, Any]) -> Dict[str, A
             
             updated_group = dict(updated_records[0]._mapping)
             
+            # Keep the per-connection group cache in step with the update
+            cache = _group_cache.get()
+            if cache is not None:
+                cache[validated_group_id] = dict(updated_group)
+            
             logger.info(f"Successfully updated user group: {updated_group['group_name']} (ID: {validated_group_id})")
             
             return {
@@ -1271,55 +1377,73 @@ def update_user_group(group_id: Any, update_data: Dict[str, Any]) -> Dict[str, A
 # ADVANCED CRUD OPERATIONS
 # =============================================================================
 
-def _validate_search_params(search_term: str, search_fields: List[str], limit: int) -> Tuple[str, List[str], int]:
-    """Validate search parameters.
+def _calculate_relevance_score(group_dict: Dict[str, Any], search_term: str, 
+                             search_fields: List[str]) -> int:
+    """Calculate relevance score for a group record.
     
     Args:
-        search_term: Term to search for
+        group_dict: Group record as dictionary
+        search_term: Search term (already cleaned)
         search_fields: Fields to search in
-        limit: Maximum results
         
     Returns:
-        Tuple of validated parameters
-        
-    Raises:
-        UserGroupValidationError: If validation fails
+        int: Relevance score (0 means no match)
     """
-    if not search_term or not search_term.strip():
-        raise UserGroupValidationError("Search term cannot be empty")
-    
-    clean_search_term = search_term.strip().lower()
-    
-    validated_fields = search_fields if search_fields else ['group_name', 'description']
+    relevance_score = 0
+    needle_len = len(search_term)
     
-    if limit <= 0 or limit > 1000:
-        raise UserGroupValidationError("Limit must be between 1 and 1000")
+    for field in search_fields:
+        field_value = group_dict.get(field)
+        if not field_value:
+            continue
+        
+        field_value = str(field_value)
+        if not field_value.islower():
+            field_value = field_value.lower()
+        
+        # A value shorter than the term can never contain it
+        if len(field_value) < needle_len:
+            continue
+        
+        # Simple scoring: exact match = 2, contains = 1
+        if field_value == search_term:
+            relevance_score += 2
+        elif search_term in field_value:
+            relevance_score += 1
     
-    return clean_search_term, validated_fields, limit
+    return relevance_score
 
 
-def _calculate_relevance_score(group_dict: Dict[str, Any], search_term: str, 
-                             search_fields: List[str]) -> int:
-    """Calculate relevance score for a group record.
+def _score_default_fields(group_dict: Dict[str, Any], search_term: str) -> int:
+    """Calculate relevance score over the default search fields.
+    
+    Specialised form of _calculate_relevance_score for DEFAULT_SEARCH_FIELDS
+    with the field loop unrolled; used for the common search path.
     
     Args:
         group_dict: Group record as dictionary
         search_term: Search term (already cleaned)
-        search_fields: Fields to search in
         
     Returns:
         int: Relevance score (0 means no match)
     """
     relevance_score = 0
     
-    for field in search_fields:
-        field_value = str(group_dict.get(field, '')).lower()
-        if search_term in field_value:
-            # Simple scoring: exact match = 2, contains = 1
-            if field_value == search_term:
-                relevance_score += 2
-            else:
-                relevance_score += 1
+    group_name = group_dict.get('group_name')
+    if group_name:
+        group_name = str(group_name).lower()
+        if group_name == search_term:
+            relevance_score += 2
+        elif search_term in group_name:
+            relevance_score += 1
+    
+    description = group_dict.get('description')
+    if description:
+        description = str(description).lower()
+        if description == search_term:
+            relevance_score += 2
+        elif search_term in description:
+            relevance_score += 1
     
     return relevance_score
 
@@ -1339,45 +1463,60 @@ def search_user_groups(search_term: str, search_fields: List[str] = None,
     Raises:
         UserGroupValidationError: If validation fails
     """
-    # Validate parameters using Pydantic
-    if search_fields is None:
-        search_fields = ['group_name', 'description']
-    
-    validated_params = validate_search_params(search_term, search_fields, limit)
+    # Defaults and validation are applied by a single Pydantic model
+    params = validate_search_params(search_term, search_fields, limit)
     
     try:
         with get_db_connection() as db:
-            # Get all groups (in production, use database search functions)
-            all_groups = db.read(table_name=USER_GROUPS_TABLE)
-            
-            # Process search results
-            matching_groups = []
-            
-            for group in all_groups:
-                group_dict = dict(group._mapping)
-                relevance_score = _calculate_relevance_score(
-                    group_dict, validated_params['search_term'], validated_params['search_fields']
+            # Stream groups through a server-side cursor and keep only the
+            # current best matches in a min-heap bounded by the limit
+            limit = params.limit
+            top_groups = []
+            total_matches = 0
+            
+            if params.search_fields == DEFAULT_SEARCH_FIELDS:
+                score_group = _score_default_fields
+            else:
+                score_group = functools.partial(
+                    _calculate_relevance_score, search_fields=params.search_fields
                 )
-                
-                if relevance_score > 0:
-                    group_dict['relevance_score'] = relevance_score
-                    matching_groups.append(group_dict)
-            
-            # Sort by relevance and limit results
-            matching_groups.sort(key=lambda x: x['relevance_score'], reverse=True)
-            limited_results = matching_groups[:validated_params['limit']]
-            
-            logger.debug(f"Search for '{search_term}' returned {len(limited_results)} results")
+
+            for index, group in enumerate(db.read_stream(table_name=USER_GROUPS_TABLE)):
+                row_mapping = group._mapping
+                relevance_score = score_group(row_mapping, params.search_term)
+
+                if relevance_score <= 0:
+                    continue
+
+                total_matches += 1
+                # (score, -index) is unique, so earlier rows win ties and the
+                # row mapping itself is never compared
+                entry = (relevance_score, -index, row_mapping)
+                if len(top_groups) < limit:
+                    heapq.heappush(top_groups, entry)
+                elif entry > top_groups[0]:
+                    heapq.heapreplace(top_groups, entry)
+
+            top_groups.sort(reverse=True)
+
+            limited_results = []
+            for relevance_score, _, row_mapping in top_groups:
+                group_dict = dict(row_mapping)
+                group_dict['relevance_score'] = relevance_score
+                limited_results.append(group_dict)
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Search for '%s' returned %d results", params.search_term, len(limited_results))
             
             return {
                 'success': True,
                 'groups': limited_results,
                 'search_metadata': {
-                    'search_term': validated_params['search_term'],
-                    'search_fields': validated_params['search_fields'],
-                    'total_matches': len(matching_groups),
+                    'search_term': params.search_term,
+                    'search_fields': list(params.search_fields),
+                    'total_matches': total_matches,
                     'returned_count': len(limited_results),
-                    'limit_applied': len(matching_groups) > validated_params['limit']
+                    'limit_applied': total_matches > limit
                 }
             }
             
@@ -1406,35 +1545,33 @@ def bulk_update_user_groups(group_updates: List[Dict[str, Any]]) -> Dict[str, An
     if len(group_updates) > 100:
         raise UserGroupValidationError("Cannot update more than 100 groups at once")
     
+    # Validate the shape of every item in a single Pydantic pass
+    validated_updates = validate_bulk_group_update_data(group_updates)
+    
     results = []
     errors = []
     
     # Process each update
-    for i, update_item in enumerate(group_updates):
+    for update_item in validated_updates:
         try:
-            if 'group_id' not in update_item or 'data' not in update_item:
-                raise UserGroupValidationError(
-                    f"Item {i}: Missing 'group_id' or 'data' field"
-                )
-            
             result = update_user_group(
-                group_id=update_item['group_id'],
-                update_data=update_item['data']
+                group_id=update_item.group_id,
+                update_data=update_item.data
             )
             results.append({
-                'group_id': update_item['group_id'],
+                'group_id': update_item.group_id,
                 'success': True,
                 'result': result
             })
             
         except (UserGroupValidationError, UserGroupNotFoundError, UserGroupUpdateError) as e:
             error_info = {
-                'group_id': update_item.get('group_id', 'unknown'),
+                'group_id': update_item.group_id,
                 'success': False,
                 'error': str(e)
             }
             errors.append(error_info)
-            logger.warning(f"Failed to update group {update_item.get('group_id')}: {e}")
+            logger.warning("Failed to update group %s: %s", update_item.group_id, e)
     
     return {
         'success': len(errors) == 0,
@@ -1451,19 +1588,22 @@ def bulk_update_user_groups(group_updates: List[Dict[str, Any]]) -> Dict[str, An
     }
 
 
-def delete_user_group_with_mappings(group_id: Any, force_delete: bool = False) -> Dict[str, Any]:
+def delete_user_group_with_mappings(group_id: Any, force_delete: bool = False,
+                                    include_deleted_records: bool = False) -> Dict[str, Any]:
     """Delete a user group and all its associated mappings with optimized operations.
     
     This function performs a transactional delete operation:
     1. Validates the group ID
-    2. Checks if the group exists and gets mappings in one database connection
-    3. Validates deletion constraints
-    4. Performs batch deletion operations
+    2. Locks the group and its mappings (SELECT ... FOR UPDATE)
+    3. Validates deletion constraints against the locked rows
+    4. Performs batch deletion operations in the same transaction
     5. Returns comprehensive operation summary
     
     Args:
         group_id: The ID of the group to delete
         force_delete: If True, delete even if mappings exist (default: False)
+        include_deleted_records: If True, return the deleted mapping records;
+                                 otherwise only their count (default: False)
         
     Returns:
         Dict[str, Any]: Summary of the deletion operation
@@ -1474,89 +1614,109 @@ def delete_user_group_with_mappings(group_id: Any, force_delete: bool = False) -
         UserGroupDeleteError: If deletion fails
     """
     try:
-        # Step 1 & 2: Validate and get group with mappings in optimized single connection
-        group_record, mappings = get_group_with_mappings(group_id)
-        validated_group_id = int(group_id)  # Already validated in get_group_with_mappings
-        
-        logger.info(f"Starting deletion process for group: {group_record['group_name']} (ID: {validated_group_id})")
-        
-        # Step 3: Optimized constraint validation
-        active_mappings = [m for m in mappings if m.get('is_active', True)]
-        
-        if active_mappings and not force_delete:
-            raise UserGroupDeleteError(
-                f"Cannot delete group '{group_record['group_name']}' - it has {len(active_mappings)} "
-                f"active user mappings. Use force_delete=True to override."
-            )
+        # Step 1: Validate the group ID
+        validated_group_id = validate_group_id(group_id)
         
-        # Step 4: Perform deletions with optimized database operations
         with get_db_connection() as db:
-            deleted_mappings = []
-            
-            # Batch delete mappings if they exist
-            if mappings:
-                logger.info(f"Deleting {len(mappings)} user mappings for group {validated_group_id}")
+            groups_table = db.get_table(USER_GROUPS_TABLE)
+            mapper_table = db.get_table(USER_GROUP_MAPPER_TABLE)
+            
+            def _delete_group_and_mappings(conn):
+                # Step 2: Lock the group and its mappings so no mapping can be
+                # added or activated between the check and the delete
+                group_row = conn.execute(
+                    select(groups_table)
+                    .where(groups_table.c.id == validated_group_id)
+                    .with_for_update()
+                ).fetchone()
                 
-                # Optimize: collect all mapping IDs for potential batch operations
-                mapping_ids = [mapping['id'] for mapping in mappings]
+                if group_row is None:
+                    raise UserGroupNotFoundError(f"User group with ID {validated_group_id} not found")
                 
-                # Delete mappings individually (can be optimized to batch delete if supported)
-                for mapping_id in mapping_ids:
-                    try:
-                        deleted_mapping = db.delete(
-                            table_name=USER_GROUP_MAPPER_TABLE,
-                            conditions={'id': mapping_id}
-                        )
-                        deleted_mappings.extend(deleted_mapping)
-                        
-                    except SQLAlchemyDeleteError as e:
-                        raise UserGroupMapperError(
-                            f"Failed to delete mapping {mapping_id}: {e}"
-                        ) from e
+                mapping_rows = conn.execute(
+                    select(mapper_table)
+                    .where(mapper_table.c.group_id == validated_group_id)
+                    .with_for_update()
+                ).fetchall()
                 
-                logger.info(f"Successfully deleted {len(deleted_mappings)} user mappings")
-            
-            # Delete the group record
-            logger.info(f"Deleting user group: {group_record['group_name']} (ID: {validated_group_id})")
-            
-            deleted_group_records = db.delete(
-                table_name=USER_GROUPS_TABLE,
-                conditions={'id': validated_group_id}
-            )
+                logger.info("Starting deletion process for group: %s (ID: %d)", group_row.group_name, validated_group_id)
+                
+                # Step 3: Constraint validation against the locked rows
+                active_count = sum(1 for m in mapping_rows if m.is_active)
+                
+                if active_count and not force_delete:
+                    raise UserGroupDeleteError(
+                        f"Cannot delete group '{group_row.group_name}' - it has {active_count} "
+                        f"active user mappings. Use force_delete=True to override."
+                    )
+                
+                # Step 4: Delete every mapping of the group in one statement,
+                # then the group itself
+                deleted_mappings = []
+                if mapping_rows:
+                    logger.info("Deleting %d user mappings for group %d", len(mapping_rows), validated_group_id)
+                    deleted_mappings = conn.execute(
+                        delete(mapper_table)
+                        .where(mapper_table.c.group_id == validated_group_id)
+                        .returning(*mapper_table.c)
+                    ).fetchall()
+                    logger.info("Successfully deleted %d user mappings", len(deleted_mappings))
+                
+                logger.info("Deleting user group: %s (ID: %d)", group_row.group_name, validated_group_id)
+                
+                deleted_group_row = conn.execute(
+                    delete(groups_table)
+                    .where(groups_table.c.id == validated_group_id)
+                    .returning(*groups_table.c)
+                ).fetchone()
+                
+                if deleted_group_row is None:
+                    raise UserGroupDeleteError(
+                        f"Failed to delete group {validated_group_id} - no records affected"
+                    )
+                
+                return deleted_group_row, deleted_mappings, active_count
             
-            if not deleted_group_records:
-                raise UserGroupDeleteError(
-                    f"Failed to delete group {validated_group_id} - no records affected"
+            try:
+                [(deleted_group_row, deleted_mappings, active_count)] = db.execute_transaction(
+                    [_delete_group_and_mappings]
                 )
+            except SQLAlchemyError as e:
+                raise UserGroupDeleteError(
+                    f"Failed to delete group {validated_group_id}: {e}"
+                ) from e
             
-            deleted_group = dict(deleted_group_records[0]._mapping)
+            deleted_group = dict(deleted_group_row._mapping)
+            _forget_cached_group(validated_group_id)
             
-            logger.info(f"Successfully deleted user group: {deleted_group['group_name']}")
+            logger.info("Successfully deleted user group: %s", deleted_group['group_name'])
             
             # Step 5: Return optimized summary
             return {
                 'success': True,
                 'deleted_group': deleted_group,
                 'deleted_mappings_count': len(deleted_mappings),
-                'deleted_mappings': [dict(m._mapping) for m in deleted_mappings],
+                'deleted_mappings': (
+                    [dict(m._mapping) for m in deleted_mappings] if include_deleted_records else None
+                ),
                 'operation_summary': {
                     'group_name': deleted_group['group_name'],
                     'group_id': validated_group_id,
                     'mappings_deleted': len(deleted_mappings),
                     'force_used': force_delete,
-                    'had_active_mappings': len(active_mappings) > 0
+                    'had_active_mappings': active_count > 0
                 },
                 'message': f"Successfully deleted group '{deleted_group['group_name']}' and {len(deleted_mappings)} associated mappings"
             }
             
     except (UserGroupValidationError, UserGroupNotFoundError, UserGroupDeleteError, UserGroupMapperError) as e:
         # Re-raise known exceptions with context
-        logger.error(f"User group deletion failed: {e}")
+        logger.error("User group deletion failed: %s", e)
         raise
         
     except Exception as e:
         # Handle unexpected errors
-        logger.error(f"Unexpected error during group deletion: {e}")
+        logger.error("Unexpected error during group deletion: %s", e)
         raise UserGroupDeleteError(
             f"Unexpected error deleting group {group_id}: {e}"
         ) from e
@@ -1589,6 +1749,10 @@ def get_user_group_summary(group_id: Any) -> Dict[str, Any]:
             else:
                 inactive_mappings.append(mapping)
         
+        # Mapping records always carry the user_id column, so the ids can be
+        # collected with C-level map/filter instead of a per-row .get()
+        user_ids = set(filter(None, map(operator.itemgetter('user_id'), mappings)))
+        
         # Return comprehensive summary with performance data
         return {
             'group': group_record,
@@ -1601,22 +1765,23 @@ def get_user_group_summary(group_id: Any) -> Dict[str, Any]:
             'deletion_info': {
                 'requires_force_delete': len(active_mappings) > 0,
                 'estimated_operations': 1 + len(mappings),  # 1 group + N mappings
-                'affected_users': len({m.get('user_id') for m in mappings if m.get('user_id')})
+                'affected_users': len(user_ids)
             },
             'mappings': mappings
         }
         
     except (UserGroupValidationError, UserGroupNotFoundError) as e:
-        logger.error(f"Failed to get group summary: {e}")
+        logger.error("Failed to get group summary: %s", e)
         raise
 
 
 # Optimized convenience functions with reduced database calls
-def delete_user_group_safe(group_id: Any) -> Dict[str, Any]:
+def delete_user_group_safe(group_id: Any, include_deleted_records: bool = False) -> Dict[str, Any]:
     """Safely delete a user group (optimized - will not delete if mappings exist).
     
     Args:
         group_id: The ID of the group to delete
+        include_deleted_records: If True, return the deleted mapping records
         
     Returns:
         Dict[str, Any]: Summary of the deletion operation
@@ -1624,19 +1789,24 @@ def delete_user_group_safe(group_id: Any) -> Dict[str, Any]:
     Raises:
         UserGroupDeleteError: If group has active mappings or deletion fails
     """
-    return delete_user_group_with_mappings(group_id, force_delete=False)
+    return delete_user_group_with_mappings(
+        group_id, force_delete=False, include_deleted_records=include_deleted_records
+    )
 
 
-def delete_user_group_force(group_id: Any) -> Dict[str, Any]:
+def delete_user_group_force(group_id: Any, include_deleted_records: bool = False) -> Dict[str, Any]:
     """Force delete a user group and all its mappings (optimized).
     
     Args:
         group_id: The ID of the group to delete
+        include_deleted_records: If True, return the deleted mapping records
         
     Returns:
         Dict[str, Any]: Summary of the deletion operation
     """
-    return delete_user_group_with_mappings(group_id, force_delete=True)
+    return delete_user_group_with_mappings(
+        group_id, force_delete=True, include_deleted_records=include_deleted_records
+    )
 
 
 def batch_get_group_summaries(group_ids: List[Any]) -> Dict[str, Dict[str, Any]]:
@@ -1654,12 +1824,22 @@ def batch_get_group_summaries(group_ids: List[Any]) -> Dict[str, Dict[str, Any]]
     results = {}
     errors = {}
     
-    for group_id in group_ids:
-        try:
-            results[str(group_id)] = get_user_group_summary(group_id)
-        except (UserGroupValidationError, UserGroupNotFoundError) as e:
-            errors[str(group_id)] = str(e)
-            logger.warning(f"Failed to get summary for group {group_id}: {e}")
+    if group_ids:
+        # Summaries are independent and I/O-bound, so overlap their queries.
+        # The worker count stays well below the engine pool size.
+        max_workers = min(BATCH_SUMMARY_MAX_WORKERS, len(group_ids))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(get_user_group_summary, group_id): group_id
+                for group_id in group_ids
+            }
+            for future in as_completed(futures):
+                group_id = futures[future]
+                try:
+                    results[str(group_id)] = future.result()
+                except (UserGroupValidationError, UserGroupNotFoundError) as e:
+                    errors[str(group_id)] = str(e)
+                    logger.warning("Failed to get summary for group %s: %s", group_id, e)
     
     return {
         'success_count': len(results),
@@ -1685,228 +1865,144 @@ def _validate_user_id(user_id_value: Any) -> int:
     Raises:
         UserGroupValidationError: If user ID is invalid
     """
-    try:
-        user_id = int(user_id_value)
-        if user_id <= 0:
-            raise UserGroupValidationError("User ID must be a positive integer")
-        return user_id
-    except (ValueError, TypeError) as e:
-        raise UserGroupValidationError(f"User ID must be a valid integer: {e}") from e
-
-
-def _validate_mapping_id(mapping_id_value: Any) -> int:
-    """Validate mapping ID parameter.
-    
-    Args:
-        mapping_id_value: The mapping ID to validate
-        
-    Returns:
-        int: Validated mapping ID
-        
-    Raises:
-        UserGroupValidationError: If mapping ID is invalid
-    """
-    try:
-        mapping_id = int(mapping_id_value)
-        if mapping_id <= 0:
-            raise UserGroupValidationError(MAPPING_ID_POSITIVE_ERROR)
-        return mapping_id
-    except (ValueError, TypeError) as e:
-        raise UserGroupValidationError(f"{MAPPING_ID_INTEGER_ERROR}: {e}") from e
-
-
-def _validate_mapper_required_fields(mapper_data: Dict[str, Any], is_update: bool) -> None:
-    """Validate required fields for mapper data.
-    
-    Args:
-        mapper_data: Dictionary containing mapper information
-        is_update: Whether this is for update operation
-        
-    Raises:
-        UserGroupValidationError: If required fields are missing
-    """
-    if not mapper_data:
-        raise UserGroupValidationError("Mapper data cannot be empty")
+    # Fast path: callers almost always pass an int already
+    if type(user_id_value) is not int:
+        try:
+            user_id_value = int(user_id_value)
+        except (ValueError, TypeError) as e:
+            raise UserGroupValidationError(f"User ID must be a valid integer: {e}") from e
     
-    if not is_update:
-        required_fields = ['user_id', 'group_id']
-        missing_fields = [field for field in required_fields if not mapper_data.get(field)]
-        
-        if missing_fields:
-            raise UserGroupValidationError(
-                f"Missing required fields: {', '.join(missing_fields)}"
-            )
+    if user_id_value <= 0:
+        raise UserGroupValidationError("User ID must be a positive integer")
+    return user_id_value
 
 
-def _process_mapper_ids(mapper_data: Dict[str, Any]) -> Dict[str, Any]:
-    """Process and validate user_id and group_id fields.
+def _bulk_insert_mappings(db_instance: PostgresDB, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Insert mappings in one multi-row statement, skipping existing pairs.
     
     Args:
-        mapper_data: Raw mapper data
+        db_instance: Database instance
+        rows: Validated mapping rows
         
     Returns:
-        Dict[str, Any]: Processed data with validated IDs
-        
-    Raises:
-        UserGroupValidationError: If validation fails
+        List[Dict[str, Any]]: Inserted mapping records; rows whose
+        (user_id, group_id) pair already existed are omitted
     """
-    processed_data = {}
-    
-    # Validate user_id
-    if 'user_id' in mapper_data:
-        processed_data['user_id'] = _validate_user_id(mapper_data['user_id'])
-    
-    # Validate group_id using existing function
-    if 'group_id' in mapper_data:
-        processed_data['group_id'] = validate_group_id(mapper_data['group_id'])
-    
-    return processed_data
+    created_records = db_instance.bulk_create_on_conflict_nothing(
+        table_name=USER_GROUP_MAPPER_TABLE,
+        data_list=rows,
+        conflict_columns=['user_id', 'group_id']
+    )
+    return [dict(record._mapping) for record in created_records]
 
 
-def _process_mapper_optional_fields(mapper_data: Dict[str, Any]) -> Dict[str, Any]:
-    """Process optional fields for mapper data.
+def _fetch_existing_ids(db_instance: PostgresDB, table_name: str, ids: Iterable[int]) -> set:
+    """Find which of the given primary keys exist in a table, in one query.
     
     Args:
-        mapper_data: Raw mapper data
+        db_instance: Database instance
+        table_name: Table to look in
+        ids: Candidate IDs
         
     Returns:
-        Dict[str, Any]: Processed optional field data
+        set: The subset of ``ids`` present in the table
     """
-    processed_data = {}
-    
-    # Validate is_active
-    if 'is_active' in mapper_data:
-        processed_data['is_active'] = bool(mapper_data['is_active'])
-    
-    # Other optional fields
-    optional_fields = ['created_by', 'updated_by', 'notes']
-    for field in optional_fields:
-        if field in mapper_data and mapper_data[field] is not None:
-            processed_data[field] = (
-                str(mapper_data[field]).strip() 
-                if isinstance(mapper_data[field], str) 
-                else mapper_data[field]
-            )
-    
-    return processed_data
+    records = db_instance.read_in(table_name=table_name, column='id', values=ids, columns=['id'])
+    return {record.id for record in records}
 
 
-def _validate_mapper_data(mapper_data: Dict[str, Any], is_update: bool = False) -> Dict[str, Any]:
-    """Validate user group mapper data.
+def _fetch_groups_by_ids(db_instance: PostgresDB, group_ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+    """Fetch several user groups in one query.
     
     Args:
-        mapper_data: Dictionary containing mapper information
-        is_update: Whether this is for update (some fields optional)
+        db_instance: PostgresDB instance
+        group_ids: Group IDs to fetch
         
     Returns:
-        Dict[str, Any]: Validated mapper data
-        
-    Raises:
-        UserGroupValidationError: If validation fails
+        Dict[int, Dict[str, Any]]: Group records keyed by group ID; missing
+        groups are simply absent
     """
-    # Validate required fields
-    _validate_mapper_required_fields(mapper_data, is_update)
-    
-    # Process IDs
-    processed_data = _process_mapper_ids(mapper_data)
-    
-    # Process optional fields
-    optional_data = _process_mapper_optional_fields(mapper_data)
-    processed_data.update(optional_data)
+    group_records = db_instance.read_in(
+        table_name=USER_GROUPS_TABLE,
+        column='id',
+        values=group_ids
+    )
     
-    return processed_data
+    return {record.id: dict(record._mapping) for record in group_records}
 
 
-def _check_user_group_mapping_exists(db_instance: PostgresDB, user_id: int, group_id: int, 
-                                    exclude_mapping_id: int = None) -> bool:
-    """Check if a user-group mapping already exists.
+def _violated_foreign_key(exc: BaseException) -> Optional[str]:
+    """Name the foreign key constraint whose violation caused a database error.
     
     Args:
-        db_instance: Database instance
-        user_id: User ID
-        group_id: Group ID
-        exclude_mapping_id: Mapping ID to exclude from check (for updates)
+        exc: Exception raised by a PostgresDB write, chained to the driver error
         
     Returns:
-        bool: True if mapping exists, False otherwise
+        Optional[str]: Constraint name ('' if the driver did not report it), or
+        None if the error was not a foreign key violation
     """
-    try:
-        existing_mappings = db_instance.read(
-            table_name=USER_GROUP_MAPPER_TABLE,
-            conditions={'user_id': user_id, 'group_id': group_id},
-            limit=1
-        )
-        
-        if existing_mappings:
-            existing_id = existing_mappings[0].id
-            if exclude_mapping_id is None or existing_id != exclude_mapping_id:
-                return True
-        
-        return False
-        
-    except SQLAlchemyReadError as e:
-        raise UserGroupMapperError(f"Failed to check mapping existence: {e}") from e
+    cause = exc.__cause__
+    if not isinstance(cause, IntegrityError):
+        return None
+    if getattr(cause.orig, 'pgcode', None) != PG_FOREIGN_KEY_VIOLATION:
+        return None
+    diag = getattr(cause.orig, 'diag', None)
+    return getattr(diag, 'constraint_name', None) or ''
 
 
-def create_user_group_mapping(mapper_data: Dict[str, Any]) -> Dict[str, Any]:
+def create_user_group_mapping(mapper_data: Dict[str, Any],
+                              db_instance: Optional[PostgresDB] = None) -> MappingCreateResult:
     """Create a new user-group mapping with validation.
     
     Args:
         mapper_data: Dictionary containing mapping information
                     Required fields: user_id, group_id
                     Optional fields: is_active, created_by, notes
+        db_instance: Optional database instance to reuse, e.g. from a caller
+                    already inside ``get_db_connection()``
     
     Returns:
-        Dict[str, Any]: Created mapping record with metadata
+        MappingCreateResult: Created mapping record (see to_dict() for metadata)
         
     Raises:
         UserGroupValidationError: If validation fails
-        UserGroupMapperError: If creation fails
+        UserGroupNotFoundError: If the group does not exist
+        UserGroupMapperError: If the user does not exist or creation fails
     """
     # Validate data using Pydantic
     validated_data = validate_mapping_create_data(mapper_data)
     
     try:
-        with get_db_connection() as db:
-            # Check if group exists
-            check_group_exists(db, validated_data['group_id'])
+        with nullcontext(db_instance) if db_instance is not None else get_db_connection() as db:
+            # Insert unless the (user_id, group_id) pair already exists; a
+            # missing group surfaces as a foreign key violation
+            created_record = db.create_on_conflict_nothing(
+                table_name=USER_GROUP_MAPPER_TABLE,
+                data=validated_data,
+                conflict_columns=['user_id', 'group_id']
+            )
             
-            # Check for duplicate mapping
-            if _check_user_group_mapping_exists(db, validated_data['user_id'], validated_data['group_id']):
+            if created_record is None:
                 raise UserGroupValidationError(
                     f"Mapping already exists between user {validated_data['user_id']} "
                     f"and group {validated_data['group_id']}"
                 )
             
-            # Create the mapping
-            created_records = db.create(
-                table_name=USER_GROUP_MAPPER_TABLE,
-                data=validated_data
-            )
-            
-            if not created_records:
-                raise UserGroupMapperError("Failed to create mapping - no records returned")
-            
-            created_mapping = dict(created_records[0]._mapping)
+            created_mapping = dict(created_record._mapping)
             
-            logger.info(f"Successfully created user-group mapping: User {created_mapping['user_id']} "
-                       f"-> Group {created_mapping['group_id']} (ID: {created_mapping['id']})")
+            logger.info("Successfully created user-group mapping: User %s -> Group %s (ID: %s)",
+                        created_mapping['user_id'], created_mapping['group_id'], created_mapping['id'])
             
-            return {
-                'success': True,
-                'mapping': created_mapping,
-                'operation_summary': {
-                    'mapping_id': created_mapping['id'],
-                    'user_id': created_mapping['user_id'],
-                    'group_id': created_mapping['group_id'],
-                    'is_active': created_mapping.get('is_active', True),
-                    'created_at': str(created_mapping.get('created_on'))
-                },
-                'message': f"Successfully created mapping between user {created_mapping['user_id']} "
-                          f"and group {created_mapping['group_id']}"
-            }
+            return MappingCreateResult(mapping=created_mapping)
             
     except SQLAlchemyInsertError as e:
+        constraint = _violated_foreign_key(e)
+        if constraint is not None:
+            if 'group_id' in constraint:
+                raise UserGroupNotFoundError(
+                    f"User group with ID {validated_data['group_id']} not found"
+                ) from e
+            raise UserGroupMapperError(f"User with ID {validated_data['user_id']} not found") from e
         raise UserGroupMapperError(f"Database error creating mapping: {e}") from e
     except (UserGroupValidationError, UserGroupMapperError, UserGroupNotFoundError):
         raise
@@ -1914,21 +2010,28 @@ def create_user_group_mapping(mapper_data: Dict[str, Any]) -> Dict[str, Any]:
         raise UserGroupMapperError(f"Unexpected error creating mapping: {e}") from e
 
 
-def read_user_group_mapping(mapping_id: Any) -> Dict[str, Any]:
+def read_user_group_mapping(mapping_id: Any) -> MappingReadResult:
     """Read a single user-group mapping by ID.
     
     Args:
         mapping_id: The ID of the mapping to read
         
     Returns:
-        Dict[str, Any]: Mapping record with metadata
+        MappingReadResult: Mapping record with group info (see to_dict() for metadata)
         
     Raises:
         UserGroupValidationError: If validation fails
         UserGroupMapperError: If mapping doesn't exist
     """
-    # Validate mapping ID
-    validated_mapping_id = _validate_mapping_id(mapping_id)
+    # Validate mapping ID inline; callers almost always pass an int already
+    validated_mapping_id = mapping_id
+    if type(validated_mapping_id) is not int:
+        try:
+            validated_mapping_id = int(validated_mapping_id)
+        except (ValueError, TypeError) as e:
+            raise UserGroupValidationError(f"{MAPPING_ID_INTEGER_ERROR}: {e}") from e
+    if validated_mapping_id <= 0:
+        raise UserGroupValidationError(MAPPING_ID_POSITIVE_ERROR)
     
     try:
         with get_db_connection() as db:
@@ -1954,17 +2057,7 @@ def read_user_group_mapping(mapping_id: Any) -> Dict[str, Any]:
             except UserGroupNotFoundError:
                 group_info = {'group_name': 'Unknown', 'group_description': None, 'group_is_active': None}
             
-            return {
-                'success': True,
-                'mapping': mapping_record,
-                'group_info': group_info,
-                'metadata': {
-                    'is_active': mapping_record.get('is_active', True),
-                    'created_at': str(mapping_record.get('created_on')),
-                    'updated_at': str(mapping_record.get('updated_on')),
-                    'has_notes': bool(mapping_record.get('notes'))
-                }
-            }
+            return MappingReadResult(mapping=mapping_record, group_info=group_info)
             
     except SQLAlchemyReadError as e:
         raise UserGroupMapperError(f"Database error reading mapping: {e}") from e
@@ -1975,7 +2068,7 @@ def read_user_group_mapping(mapping_id: Any) -> Dict[str, Any]:
 
 
 def read_user_group_mappings(filters: Dict[str, Any] = None, limit: int = None, 
-                           offset: int = 0) -> Dict[str, Any]:
+                           offset: int = 0) -> MappingListResult:
     """Read multiple user-group mappings with optional filtering and pagination.
     
     Args:
@@ -1984,7 +2077,7 @@ def read_user_group_mappings(filters: Dict[str, Any] = None, limit: int = None,
         offset: Number of records to skip
         
     Returns:
-        Dict[str, Any]: List of mapping records with metadata
+        MappingListResult: Mapping records with pagination counts
         
     Raises:
         UserGroupValidationError: If validation fails
@@ -2001,51 +2094,42 @@ def read_user_group_mappings(filters: Dict[str, Any] = None, limit: int = None,
             if offset < 0:
                 raise UserGroupValidationError("Offset must be non-negative")
             
-            # Read mappings with pagination
-            mappings = db.read(
+            # Read the page together with the total and active counts, which
+            # come back from window aggregates in the same statement
+            mapping_records, total_count, active_count = db.read_page_with_counts(
                 table_name=USER_GROUP_MAPPER_TABLE,
                 conditions=conditions,
                 limit=limit,
-                offset=offset
+                offset=offset,
+                flag_column='is_active'
             )
             
-            # Convert to list of dictionaries
-            mapping_records = [dict(mapping._mapping) for mapping in mappings]
-            
-            # Get total count for pagination metadata
-            total_count = len(db.read(
-                table_name=USER_GROUP_MAPPER_TABLE,
-                conditions=conditions
-            ))
+            # Enhance with group information fetched in a single IN query
+            groups_by_id = _fetch_groups_by_ids(
+                db, {mapping['group_id'] for mapping in mapping_records}
+            )
             
-            # Enhance with group information
             enhanced_mappings = []
             for mapping in mapping_records:
-                try:
-                    group_record = check_group_exists(db, mapping['group_id'])
+                group_record = groups_by_id.get(mapping['group_id'])
+                if group_record is not None:
                     mapping['group_name'] = group_record['group_name']
                     mapping['group_description'] = group_record.get('description')
-                except UserGroupNotFoundError:
+                else:
                     mapping['group_name'] = 'Unknown'
                     mapping['group_description'] = None
                 
                 enhanced_mappings.append(mapping)
             
-            logger.debug(f"Retrieved {len(enhanced_mappings)} user-group mappings (total: {total_count})")
+            logger.debug("Retrieved %d user-group mappings (total: %d)", len(enhanced_mappings), total_count)
             
-            return {
-                'success': True,
-                'mappings': enhanced_mappings,
-                'metadata': {
-                    'total_count': total_count,
-                    'returned_count': len(enhanced_mappings),
-                    'limit': limit,
-                    'offset': offset,
-                    'has_more': limit and (offset + len(enhanced_mappings)) < total_count,
-                    'active_count': len([m for m in enhanced_mappings if m.get('is_active', True)]),
-                    'inactive_count': len([m for m in enhanced_mappings if not m.get('is_active', True)])
-                }
-            }
+            return MappingListResult(
+                mappings=enhanced_mappings,
+                total_count=total_count,
+                active_count=active_count,
+                limit=limit,
+                offset=offset
+            )
             
     except SQLAlchemyReadError as e:
         raise UserGroupValidationError(f"Database error reading mappings: {e}") from e
@@ -2053,16 +2137,107 @@ def read_user_group_mappings(filters: Dict[str, Any] = None, limit: int = None,
         raise UserGroupValidationError(f"Unexpected error reading mappings: {e}") from e
 
 
-def update_user_group_mapping(mapping_id: Any, update_data: Dict[str, Any]) -> Dict[str, Any]:
+def _iter_user_group_mappings(db: PostgresDB, conditions: Dict[str, Any],
+                              chunk_size: int) -> Iterator[Dict[str, Any]]:
+    """Generator behind read_user_group_mappings_iter, run with checked arguments.
+    
+    Args:
+        db: PostgresDB instance
+        conditions: Filters whose keys are known mapper columns
+        chunk_size: Positive number of rows fetched and enriched per round-trip
+        
+    Yields:
+        Dict[str, Any]: Mapping records with 'group_name' and 'group_description'
+        
+    Raises:
+        UserGroupValidationError: If the read fails
+    """
+    try:
+        groups_by_id: Dict[int, Dict[str, Any]] = {}
+        rows = db.read_stream(USER_GROUP_MAPPER_TABLE, conditions, batch_size=chunk_size)
+        
+        while True:
+            chunk = [dict(row._mapping) for row in itertools.islice(rows, chunk_size)]
+            if not chunk:
+                break
+            
+            missing_ids = {mapping['group_id'] for mapping in chunk} - groups_by_id.keys()
+            if missing_ids:
+                groups_by_id.update(_fetch_groups_by_ids(db, missing_ids))
+            
+            for mapping in chunk:
+                group_record = groups_by_id.get(mapping['group_id'])
+                if group_record is not None:
+                    mapping['group_name'] = group_record['group_name']
+                    mapping['group_description'] = group_record.get('description')
+                else:
+                    mapping['group_name'] = 'Unknown'
+                    mapping['group_description'] = None
+                yield mapping
+                    
+    except SQLAlchemyReadError as e:
+        raise UserGroupValidationError(f"Database error streaming mappings: {e}") from e
+
+
+def read_user_group_mappings_iter(filters: Dict[str, Any] = None,
+                                  chunk_size: int = 1000) -> Iterator[Dict[str, Any]]:
+    """Stream user-group mappings with group information, one record at a time.
+    
+    Rows are read through a server-side cursor and enriched in chunks, so memory
+    use is bounded by ``chunk_size`` rather than by the number of matching
+    mappings. Group records are fetched with one IN query per chunk for group IDs
+    not seen before. Intended for large exports where ``read_user_group_mappings``
+    would materialize the whole result.
+    
+    Arguments are checked when this function is called; database errors while
+    streaming are raised from the returned iterator.
+    
+    The shared instance is used directly rather than through
+    ``get_db_connection()``: a generator would otherwise hold that block's
+    group cache open across ``yield`` and into the consumer's code.
+    
+    Args:
+        filters: Optional filters (e.g., {'user_id': 123, 'is_active': True})
+        chunk_size: Number of rows fetched and enriched per round-trip
+        
+    Returns:
+        Iterator[Dict[str, Any]]: Mapping records with 'group_name' and
+        'group_description'
+        
+    Raises:
+        UserGroupValidationError: If validation fails or the read fails
+    """
+    if chunk_size <= 0:
+        raise UserGroupValidationError("Chunk size must be a positive integer")
+    
+    conditions = filters if filters else {}
+    
+    db: PostgresDB = get_session()
+    try:
+        mapper_table = db.get_table(USER_GROUP_MAPPER_TABLE)
+    except SQLAlchemyReadError as e:
+        raise UserGroupValidationError(f"Database error streaming mappings: {e}") from e
+    
+    unknown_keys = sorted(str(key) for key in conditions.keys() - set(mapper_table.c.keys()))
+    if unknown_keys:
+        raise UserGroupValidationError(f"Unknown mapping filter fields: {', '.join(unknown_keys)}")
+    
+    return _iter_user_group_mappings(db, conditions, chunk_size)
+
+
+def update_user_group_mapping(mapping_id: Any, update_data: Dict[str, Any],
+                              db_instance: Optional[PostgresDB] = None) -> MappingUpdateResult:
     """Update a user-group mapping with validation.
     
     Args:
         mapping_id: The ID of the mapping to update
         update_data: Dictionary containing fields to update
                     Allowed fields: is_active, updated_by, notes
+        db_instance: Optional database instance to reuse, e.g. from a caller
+                    already inside ``get_db_connection()``
     
     Returns:
-        Dict[str, Any]: Updated mapping record with metadata
+        MappingUpdateResult: Updated mapping record (see to_dict() for metadata)
         
     Raises:
         UserGroupValidationError: If validation fails
@@ -2073,52 +2248,45 @@ def update_user_group_mapping(mapping_id: Any, update_data: Dict[str, Any]) -> D
     validated_update_data = validate_mapping_update_data(update_data)
     
     try:
-        with get_db_connection() as db:
-            # Check if mapping exists
-            existing_mapping = db.read(
-                table_name=USER_GROUP_MAPPER_TABLE,
-                conditions={'id': validated_mapping_id},
-                limit=1
+        with nullcontext(db_instance) if db_instance is not None else get_db_connection() as db:
+            mapper_table = db.get_table(USER_GROUP_MAPPER_TABLE)
+            
+            # The subquery runs against the pre-update snapshot, so RETURNING
+            # carries the previous is_active without a separate read
+            previous = mapper_table.alias('previous')
+            was_active = (
+                select(previous.c.is_active)
+                .where(previous.c.id == validated_mapping_id)
+                .scalar_subquery()
+                .label('was_active')
             )
-            
-            if not existing_mapping:
-                raise UserGroupMapperError(f"User-group mapping with ID {validated_mapping_id} not found")
-            
-            existing_record = dict(existing_mapping[0]._mapping)
-            
-            # Perform update
-            updated_records = db.update(
-                table_name=USER_GROUP_MAPPER_TABLE,
-                conditions={'id': validated_mapping_id},
-                data=validated_update_data
+            stmt = (
+                update(mapper_table)
+                .where(mapper_table.c.id == validated_mapping_id)
+                .values(**validated_update_data)
+                .returning(*mapper_table.c, was_active)
             )
             
-            if not updated_records:
-                raise UserGroupMapperError(
-                    f"Failed to update mapping {validated_mapping_id} - no records affected"
-                )
+            try:
+                [updated_row] = db.execute_transaction([lambda conn: conn.execute(stmt).fetchone()])
+            except SQLAlchemyError as e:
+                raise UserGroupMapperError(f"Database error updating mapping: {e}") from e
             
-            updated_mapping = dict(updated_records[0]._mapping)
+            # No returned row means the mapping does not exist
+            if updated_row is None:
+                raise UserGroupMapperError(f"User-group mapping with ID {validated_mapping_id} not found")
             
-            logger.info(f"Successfully updated user-group mapping ID {validated_mapping_id}: "
-                       f"User {updated_mapping['user_id']} -> Group {updated_mapping['group_id']}")
+            updated_mapping = dict(updated_row._mapping)
+            previous_is_active = updated_mapping.pop('was_active')
             
-            return {
-                'success': True,
-                'mapping': updated_mapping,
-                'changes': validated_update_data,
-                'operation_summary': {
-                    'mapping_id': validated_mapping_id,
-                    'user_id': updated_mapping['user_id'],
-                    'group_id': updated_mapping['group_id'],
-                    'fields_updated': list(validated_update_data.keys()),
-                    'updated_at': str(updated_mapping.get('updated_on')),
-                    'was_active': existing_record.get('is_active'),
-                    'now_active': updated_mapping.get('is_active')
-                },
-                'message': f"Successfully updated mapping between user {updated_mapping['user_id']} "
-                          f"and group {updated_mapping['group_id']}"
-            }
+            logger.info("Successfully updated user-group mapping ID %s: User %s -> Group %s",
+                        validated_mapping_id, updated_mapping['user_id'], updated_mapping['group_id'])
+            
+            return MappingUpdateResult(
+                mapping=updated_mapping,
+                changes=validated_update_data,
+                was_active=previous_is_active
+            )
             
     except SQLAlchemyUpdateError as e:
         raise UserGroupMapperError(f"Database error updating mapping: {e}") from e
@@ -2128,73 +2296,62 @@ def update_user_group_mapping(mapping_id: Any, update_data: Dict[str, Any]) -> D
         raise UserGroupMapperError(f"Unexpected error updating mapping: {e}") from e
 
 
-def delete_user_group_mapping(mapping_id: Any) -> Dict[str, Any]:
+def delete_user_group_mapping(mapping_id: Any) -> MappingDeleteResult:
     """Delete a user-group mapping.
     
     Args:
         mapping_id: The ID of the mapping to delete
         
     Returns:
-        Dict[str, Any]: Summary of the deletion operation
+        MappingDeleteResult: Deleted mapping record (see to_dict() for summary)
         
     Raises:
         UserGroupValidationError: If validation fails
         UserGroupMapperError: If mapping doesn't exist or deletion fails
     """
-    # Validate mapping ID
-    validated_mapping_id = _validate_mapping_id(mapping_id)
+    # Validate mapping ID inline; callers almost always pass an int already
+    validated_mapping_id = mapping_id
+    if type(validated_mapping_id) is not int:
+        try:
+            validated_mapping_id = int(validated_mapping_id)
+        except (ValueError, TypeError) as e:
+            raise UserGroupValidationError(f"{MAPPING_ID_INTEGER_ERROR}: {e}") from e
+    if validated_mapping_id <= 0:
+        raise UserGroupValidationError(MAPPING_ID_POSITIVE_ERROR)
     
     try:
         with get_db_connection() as db:
-            # Get mapping info before deletion
-            existing_mapping = db.read(
-                table_name=USER_GROUP_MAPPER_TABLE,
-                conditions={'id': validated_mapping_id},
-                limit=1
+            mapper_table = db.get_table(USER_GROUP_MAPPER_TABLE)
+            groups_table = db.get_table(USER_GROUPS_TABLE)
+            
+            # WITH deleted AS (DELETE ... RETURNING *) SELECT deleted.*, group_name
+            # FROM deleted LEFT JOIN user_groups - one round-trip for everything
+            deleted = (
+                delete(mapper_table)
+                .where(mapper_table.c.id == validated_mapping_id)
+                .returning(*mapper_table.c)
+                .cte('deleted')
+            )
+            stmt = select(deleted, groups_table.c.group_name).select_from(
+                deleted.outerjoin(groups_table, groups_table.c.id == deleted.c.group_id)
             )
             
-            if not existing_mapping:
-                raise UserGroupMapperError(f"User-group mapping with ID {validated_mapping_id} not found")
-            
-            mapping_record = dict(existing_mapping[0]._mapping)
-            
-            # Get group info for better logging
             try:
-                group_record = check_group_exists(db, mapping_record['group_id'])
-                group_name = group_record['group_name']
-            except UserGroupNotFoundError:
-                group_name = f"Group {mapping_record['group_id']}"
-            
-            # Delete the mapping
-            deleted_records = db.delete(
-                table_name=USER_GROUP_MAPPER_TABLE,
-                conditions={'id': validated_mapping_id}
-            )
+                [deleted_row] = db.execute_transaction([lambda conn: conn.execute(stmt).fetchone()])
+            except SQLAlchemyError as e:
+                raise UserGroupMapperError(f"Database error deleting mapping: {e}") from e
             
-            if not deleted_records:
-                raise UserGroupMapperError(
-                    f"Failed to delete mapping {validated_mapping_id} - no records affected"
-                )
+            # No returned row means the mapping does not exist
+            if deleted_row is None:
+                raise UserGroupMapperError(f"User-group mapping with ID {validated_mapping_id} not found")
             
-            deleted_mapping = dict(deleted_records[0]._mapping)
+            deleted_mapping = dict(deleted_row._mapping)
+            group_name = deleted_mapping.pop('group_name') or f"Group {deleted_mapping['group_id']}"
             
-            logger.info(f"Successfully deleted user-group mapping ID {validated_mapping_id}: "
-                       f"User {deleted_mapping['user_id']} -> {group_name}")
+            logger.info("Successfully deleted user-group mapping ID %s: User %s -> %s",
+                        validated_mapping_id, deleted_mapping['user_id'], group_name)
             
-            return {
-                'success': True,
-                'deleted_mapping': deleted_mapping,
-                'operation_summary': {
-                    'mapping_id': validated_mapping_id,
-                    'user_id': deleted_mapping['user_id'],
-                    'group_id': deleted_mapping['group_id'],
-                    'group_name': group_name,
-                    'was_active': deleted_mapping.get('is_active', True),
-                    'deleted_at': str(deleted_mapping.get('updated_on', deleted_mapping.get('created_on')))
-                },
-                'message': f"Successfully deleted mapping between user {deleted_mapping['user_id']} "
-                          f"and {group_name}"
-            }
+            return MappingDeleteResult(deleted_mapping=deleted_mapping, group_name=group_name)
             
     except SQLAlchemyDeleteError as e:
         raise UserGroupMapperError(f"Database error deleting mapping: {e}") from e
@@ -2224,35 +2381,40 @@ def get_user_group_mappings_by_user(user_id: Any, include_inactive: bool = False
     # Validate user ID
     validated_user_id = _validate_user_id(user_id)
     
+    # Build filters
+    filters = {'user_id': validated_user_id}
+    if not include_inactive:
+        filters['is_active'] = True
+    
+    # Get mappings
     try:
-        # Build filters
-        filters = {'user_id': validated_user_id}
-        if not include_inactive:
-            filters['is_active'] = True
-        
-        # Get mappings
         result = read_user_group_mappings(filters=filters)
-        
-        # Enhance with summary data
-        mappings = result['mappings']
-        active_mappings = [m for m in mappings if m.get('is_active', True)]
-        group_names = [m.get('group_name', 'Unknown') for m in active_mappings]
-        
-        return {
-            'success': True,
-            'user_id': validated_user_id,
-            'mappings': mappings,
-            'summary': {
-                'total_mappings': len(mappings),
-                'active_mappings': len(active_mappings),
-                'inactive_mappings': len(mappings) - len(active_mappings),
-                'group_names': group_names,
-                'group_count': len({m['group_id'] for m in active_mappings})
-            }
-        }
-        
     except Exception as e:
         raise UserGroupValidationError(f"Error getting user mappings: {e}") from e
+    
+    # Counts come from the window aggregates of the read itself
+    mappings = result.mappings
+    
+    # Collect names and distinct groups of active mappings in one pass
+    group_names = []
+    group_ids = set()
+    for mapping in mappings:
+        if mapping.get('is_active', True):
+            group_names.append(mapping.get('group_name', 'Unknown'))
+            group_ids.add(mapping['group_id'])
+    
+    return {
+        'success': True,
+        'user_id': validated_user_id,
+        'mappings': mappings,
+        'summary': {
+            'total_mappings': result.total_count,
+            'active_mappings': result.active_count,
+            'inactive_mappings': result.inactive_count,
+            'group_names': group_names,
+            'group_count': len(group_ids)
+        }
+    }
 
 
 def get_group_user_mappings(group_id: Any, include_inactive: bool = False) -> Dict[str, Any]:
@@ -2274,121 +2436,148 @@ def get_group_user_mappings(group_id: Any, include_inactive: bool = False) -> Di
     
     try:
         with get_db_connection() as db:
-            # Verify group exists
-            group_record = check_group_exists(db, validated_group_id)
-            
-            # Build filters
-            filters = {'group_id': validated_group_id}
-            if not include_inactive:
-                filters['is_active'] = True
-            
-            # Get mappings
-            result = read_user_group_mappings(filters=filters)
-            mappings = result['mappings']
-            
-            # Calculate summary
-            active_mappings = [m for m in mappings if m.get('is_active', True)]
-            user_ids = [m['user_id'] for m in active_mappings]
-            
-            return {
-                'success': True,
-                'group': group_record,
-                'mappings': mappings,
-                'summary': {
-                    'total_mappings': len(mappings),
-                    'active_mappings': len(active_mappings),
-                    'inactive_mappings': len(mappings) - len(active_mappings),
-                    'user_ids': user_ids,
-                    'unique_users': len(set(user_ids))
-                }
-            }
-            
-    except (UserGroupValidationError, UserGroupNotFoundError):
+            # The group and its mappings come back from a single JOIN
+            group_record, mappings = _read_group_with_mappings(
+                db, validated_group_id, include_inactive
+            )
+    except UserGroupValidationError:
         raise
     except Exception as e:
         raise UserGroupValidationError(f"Error getting group mappings: {e}") from e
+    
+    if group_record is None:
+        raise UserGroupNotFoundError(f"User group with ID {validated_group_id} not found")
+    
+    user_ids = [m['user_id'] for m in mappings if m.get('is_active', True)]
+    
+    return {
+        'success': True,
+        'group': group_record,
+        'mappings': mappings,
+        'summary': {
+            'total_mappings': len(mappings),
+            'active_mappings': len(user_ids),
+            'inactive_mappings': len(mappings) - len(user_ids),
+            'user_ids': user_ids,
+            'unique_users': len(set(user_ids))
+        }
+    }
 
 
-def bulk_create_user_group_mappings(mappings_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+def bulk_create_user_group_mappings(mappings_data: List[Dict[str, Any]]) -> BulkMappingCreateResult:
     """Create multiple user-group mappings in batch.
     
+    Referenced users and groups are checked with one IN query each, then all
+    remaining mappings go to the database in a single
+    ``INSERT ... ON CONFLICT (user_id, group_id) DO NOTHING RETURNING *``;
+    pairs that were not returned already existed and are reported as skipped.
+    
     Args:
         mappings_data: List of mapping dictionaries
                       Format: [{'user_id': 1, 'group_id': 2}, ...]
     
     Returns:
-        Dict[str, Any]: Summary of bulk creation operation
+        BulkMappingCreateResult: Per-row outcomes (see to_dict() for the summary)
         
     Raises:
         UserGroupValidationError: If validation fails
+        UserGroupMapperError: If the insert fails
     """
     # Validate using Pydantic
     validated_mappings = validate_bulk_mapping_create_data(mappings_data)
+    pairs = [(m['user_id'], m['group_id']) for m in validated_mappings]
     
-    results = []
     errors = []
-    skipped = []
+    failed_indexes = set()
+    failed_pairs = []
+    rows_to_insert = []
     
-    # Process each mapping
-    for i, validated_data in enumerate(validated_mappings):
-        try:
-            with get_db_connection() as db:
-                if _check_user_group_mapping_exists(db, validated_data['user_id'], validated_data['group_id']):
-                    skipped.append({
-                        'index': i,
-                        'user_id': validated_data['user_id'],
-                        'group_id': validated_data['group_id'],
-                        'reason': 'Mapping already exists'
-                    })
-                    continue
+    try:
+        with get_db_connection() as db:
+            # Two IN queries check every referenced user and group up front
+            existing_user_ids = _fetch_existing_ids(
+                db, USERS_TABLE, {user_id for user_id, _ in pairs}
+            )
+            existing_group_ids = _fetch_existing_ids(
+                db, USER_GROUPS_TABLE, {group_id for _, group_id in pairs}
+            )
             
-            # Create the mapping
-            result = create_user_group_mapping(validated_data)
-            results.append({
-                'index': i,
-                'success': True,
-                'mapping': result['mapping'],
-                'user_id': result['mapping']['user_id'],
-                'group_id': result['mapping']['group_id']
-            })
+            for i, (validated_data, pair) in enumerate(zip(validated_mappings, pairs)):
+                user_id, group_id = pair
+                if user_id not in existing_user_ids:
+                    error = f"User with ID {user_id} not found"
+                elif group_id not in existing_group_ids:
+                    error = f"User group with ID {group_id} not found"
+                else:
+                    rows_to_insert.append(validated_data)
+                    continue
+                
+                errors.append({
+                    'index': i,
+                    'success': False,
+                    'error': error,
+                    'user_id': user_id,
+                    'group_id': group_id
+                })
+                failed_indexes.add(i)
+                failed_pairs.append(pair)
             
-        except (UserGroupValidationError, UserGroupMapperError, UserGroupNotFoundError) as e:
-            error_info = {
-                'index': i,
-                'success': False,
-                'error': str(e),
-                'user_id': validated_data.get('user_id', 'unknown'),
-                'group_id': validated_data.get('group_id', 'unknown')
-            }
-            errors.append(error_info)
-            logger.warning(f"Failed to create mapping {i}: {e}")
+            created_mappings = _bulk_insert_mappings(db, rows_to_insert) if rows_to_insert else []
+    except SQLAlchemyReadError as e:
+        raise UserGroupMapperError(f"Database error checking users and groups: {e}") from e
+    except SQLAlchemyInsertError as e:
+        raise UserGroupMapperError(f"Database error creating mappings: {e}") from e
     
-    return {
-        'success': len(errors) == 0,
-        'total_processed': len(mappings_data),
-        'successful_creations': len(results),
-        'failed_creations': len(errors),
-        'skipped_duplicates': len(skipped),
-        'results': results,
-        'errors': errors,
-        'skipped': skipped,
-        'summary': {
-            'success_rate': len(results) / len(mappings_data) * 100 if mappings_data else 0,
-            'created_mappings': [(r['user_id'], r['group_id']) for r in results],
-            'failed_mappings': [(e['user_id'], e['group_id']) for e in errors]
-        }
+    created_by_pair = {
+        (mapping['user_id'], mapping['group_id']): mapping for mapping in created_mappings
     }
+    
+    created = []
+    skipped = []
+    for i, pair in enumerate(pairs):
+        if i in failed_indexes:
+            continue
+        mapping = created_by_pair.get(pair)
+        if mapping is not None:
+            created.append((i, mapping))
+        else:
+            skipped.append((i, *pair))
+    
+    return BulkMappingCreateResult(
+        created=created,
+        skipped=skipped,
+        errors=errors,
+        failed_pairs=failed_pairs,
+        total_processed=len(mappings_data)
+    )
+
+
+def _execute_fetchall(stmt: Any, conn: Any) -> List[Any]:
+    """Execute a statement on a transaction connection and fetch all rows.
+    
+    Args:
+        stmt: SQLAlchemy statement to execute
+        conn: Connection supplied by ``PostgresDB.execute_transaction``
+        
+    Returns:
+        List[Any]: Result rows
+    """
+    return conn.execute(stmt).fetchall()
 
 
-def bulk_update_user_group_mappings(mapping_updates: List[Dict[str, Any]]) -> Dict[str, Any]:
+def bulk_update_user_group_mappings(mapping_updates: List[Dict[str, Any]]) -> BulkMappingUpdateResult:
     """Update multiple user-group mappings in batch.
     
+    Items that request the same changes are applied together with one
+    ``UPDATE ... WHERE id IN (...) RETURNING`` per distinct change set, all in
+    a single transaction.
+    
     Args:
         mapping_updates: List of dictionaries with 'mapping_id' and update data
                         Format: [{'mapping_id': 1, 'data': {'is_active': False}}, ...]
     
     Returns:
-        Dict[str, Any]: Summary of bulk update operation
+        BulkMappingUpdateResult: Per-item outcomes (see to_dict() for the summary)
         
     Raises:
         UserGroupValidationError: If validation fails
@@ -2399,10 +2588,15 @@ def bulk_update_user_group_mappings(mapping_updates: List[Dict[str, Any]]) -> Di
     if len(mapping_updates) > 100:
         raise UserGroupValidationError("Cannot update more than 100 mappings at once")
     
-    results = []
+    updated = []
     errors = []
+    failed_ids = []
     
-    # Process each update
+    # Validate every item and bucket identical change sets together, so each
+    # distinct update shape becomes one UPDATE ... WHERE id IN (...) statement
+    updates_by_changes: Dict[Tuple, List[int]] = {}
+    changes_by_key: Dict[Tuple, Dict[str, Any]] = {}
+    seen_ids = set()
     for i, update_item in enumerate(mapping_updates):
         try:
             if 'mapping_id' not in update_item or 'data' not in update_item:
@@ -2410,38 +2604,94 @@ def bulk_update_user_group_mappings(mapping_updates: List[Dict[str, Any]]) -> Di
                     f"Item {i}: Missing 'mapping_id' or 'data' field"
                 )
             
-            result = update_user_group_mapping(
-                mapping_id=update_item['mapping_id'],
-                update_data=update_item['data']
-            )
-            results.append({
-                'mapping_id': update_item['mapping_id'],
-                'success': True,
-                'result': result
-            })
+            mapping_id = validate_positive_integer(update_item['mapping_id'], "Mapping ID")
+            if mapping_id in seen_ids:
+                raise UserGroupValidationError(
+                    f"Item {i}: Mapping ID {mapping_id} appears more than once"
+                )
+            seen_ids.add(mapping_id)
             
-        except (UserGroupValidationError, UserGroupMapperError) as e:
-            error_info = {
+            validated_update_data = validate_mapping_update_data(update_item['data'])
+            changes_key = tuple(sorted(validated_update_data.items()))
+            changes_by_key[changes_key] = validated_update_data
+            updates_by_changes.setdefault(changes_key, []).append(mapping_id)
+            
+        except UserGroupValidationError as e:
+            errors.append({
                 'mapping_id': update_item.get('mapping_id', 'unknown'),
                 'success': False,
                 'error': str(e)
-            }
-            errors.append(error_info)
-            logger.warning(f"Failed to update mapping {update_item.get('mapping_id')}: {e}")
+            })
+            failed_ids.append(update_item.get('mapping_id', 'unknown'))
+            logger.warning("Failed to update mapping %s: %s", update_item.get('mapping_id'), e)
     
-    return {
-        'success': len(errors) == 0,
-        'total_processed': len(mapping_updates),
-        'successful_updates': len(results),
-        'failed_updates': len(errors),
-        'results': results,
-        'errors': errors,
-        'summary': {
-            'success_rate': len(results) / len(mapping_updates) * 100 if mapping_updates else 0,
-            'mappings_updated': [r['mapping_id'] for r in results],
-            'mappings_failed': [e['mapping_id'] for e in errors]
-        }
-    }
+    if updates_by_changes:
+        try:
+            with get_db_connection() as db:
+                mapper_table = db.get_table(USER_GROUP_MAPPER_TABLE)
+                
+                # Evaluated against the pre-update snapshot, as in
+                # update_user_group_mapping
+                previous = mapper_table.alias('previous')
+                was_active = (
+                    select(previous.c.is_active)
+                    .where(previous.c.id == mapper_table.c.id)
+                    .correlate(mapper_table)
+                    .scalar_subquery()
+                    .label('was_active')
+                )
+                
+                operations = [
+                    functools.partial(
+                        _execute_fetchall,
+                        update(mapper_table)
+                        .where(mapper_table.c.id.in_(mapping_ids))
+                        .values(**changes_by_key[changes_key])
+                        .returning(*mapper_table.c, was_active)
+                    )
+                    for changes_key, mapping_ids in updates_by_changes.items()
+                ]
+                updated_rows_per_shape = db.execute_transaction(operations)
+                
+        except (SQLAlchemyError, SQLAlchemyReadError) as e:
+            for mapping_ids in updates_by_changes.values():
+                errors.extend(
+                    {'mapping_id': mapping_id, 'success': False,
+                     'error': f"Database error updating mapping: {e}"}
+                    for mapping_id in mapping_ids
+                )
+                failed_ids.extend(mapping_ids)
+            logger.warning("Failed to apply bulk mapping update: %s", e)
+        else:
+            for changes_key, updated_rows in zip(updates_by_changes, updated_rows_per_shape):
+                changes = changes_by_key[changes_key]
+                shape_updated_ids = set()
+                for row in updated_rows:
+                    updated_mapping = dict(row._mapping)
+                    previous_is_active = updated_mapping.pop('was_active')
+                    shape_updated_ids.add(updated_mapping['id'])
+                    updated.append(MappingUpdateResult(
+                        mapping=updated_mapping,
+                        changes=changes,
+                        was_active=previous_is_active
+                    ))
+                
+                # IDs missing from RETURNING did not exist
+                for mapping_id in updates_by_changes[changes_key]:
+                    if mapping_id not in shape_updated_ids:
+                        errors.append({
+                            'mapping_id': mapping_id,
+                            'success': False,
+                            'error': f"User-group mapping with ID {mapping_id} not found"
+                        })
+                        failed_ids.append(mapping_id)
+    
+    return BulkMappingUpdateResult(
+        updated=updated,
+        errors=errors,
+        failed_ids=failed_ids,
+        total_processed=len(mapping_updates)
+    )
 
 
 def deactivate_user_from_group(user_id: Any, group_id: Any) -> Dict[str, Any]:
@@ -2464,14 +2714,15 @@ def deactivate_user_from_group(user_id: Any, group_id: Any) -> Dict[str, Any]:
     
     try:
         with get_db_connection() as db:
-            # Find the active mapping
-            mappings = db.read(
+            # Find the active mapping; only its ID is needed
+            mappings = db.read_mappings(
                 table_name=USER_GROUP_MAPPER_TABLE,
                 conditions={
                     'user_id': validated_user_id,
                     'group_id': validated_group_id,
                     'is_active': True
                 },
+                columns=['id'],
                 limit=1
             )
             
@@ -2481,38 +2732,42 @@ def deactivate_user_from_group(user_id: Any, group_id: Any) -> Dict[str, Any]:
                     f"and group {validated_group_id}"
                 )
             
-            mapping_record = mappings[0]
-            mapping_id = mapping_record.id
+            mapping_id = mappings[0]['id']
             
             # Deactivate the mapping
             result = update_user_group_mapping(
                 mapping_id=mapping_id,
-                update_data={'is_active': False}
+                update_data={'is_active': False},
+                db_instance=db
             )
             
-            return {
-                'success': True,
-                'deactivated_mapping': result['mapping'],
-                'operation_summary': {
-                    'user_id': validated_user_id,
-                    'group_id': validated_group_id,
-                    'mapping_id': mapping_id,
-                    'action': 'deactivated'
-                },
-                'message': f"Successfully deactivated user {validated_user_id} from group {validated_group_id}"
-            }
-            
     except SQLAlchemyReadError as e:
         raise UserGroupMapperError(f"Database error finding mapping: {e}") from e
     except (UserGroupValidationError, UserGroupMapperError):
         raise
     except Exception as e:
         raise UserGroupMapperError(f"Unexpected error deactivating mapping: {e}") from e
+    
+    return {
+        'success': True,
+        'deactivated_mapping': result.mapping,
+        'operation_summary': {
+            'user_id': validated_user_id,
+            'group_id': validated_group_id,
+            'mapping_id': mapping_id,
+            'action': 'deactivated'
+        },
+        'message': f"Successfully deactivated user {validated_user_id} from group {validated_group_id}"
+    }
 
 
 def activate_user_in_group(user_id: Any, group_id: Any) -> Dict[str, Any]:
     """Activate a user in a group (reactivate existing mapping or create new).
     
+    Runs as one ``INSERT ... ON CONFLICT (user_id, group_id) DO UPDATE SET
+    is_active = TRUE RETURNING`` statement, so there is no window between
+    checking for a mapping and writing it.
+    
     Args:
         user_id: The user ID
         group_id: The group ID
@@ -2522,7 +2777,8 @@ def activate_user_in_group(user_id: Any, group_id: Any) -> Dict[str, Any]:
         
     Raises:
         UserGroupValidationError: If validation fails
-        UserGroupMapperError: If operation fails
+        UserGroupNotFoundError: If the group does not exist
+        UserGroupMapperError: If the user does not exist or the operation fails
     """
     # Validate using Pydantic
     validated_params = validate_user_group_activation(user_id, group_id)
@@ -2531,71 +2787,71 @@ def activate_user_in_group(user_id: Any, group_id: Any) -> Dict[str, Any]:
     
     try:
         with get_db_connection() as db:
-            # Check if any mapping exists (active or inactive)
-            existing_mappings = db.read(
-                table_name=USER_GROUP_MAPPER_TABLE,
-                conditions={
-                    'user_id': validated_user_id,
-                    'group_id': validated_group_id
-                },
-                limit=1
+            mapper_table = db.get_table(USER_GROUP_MAPPER_TABLE)
+            
+            # The subquery sees the pre-statement snapshot: NULL means the row
+            # is new, otherwise it is the status before activation
+            previous = mapper_table.alias('previous')
+            was_active = (
+                select(previous.c.is_active)
+                .where(
+                    previous.c.user_id == validated_user_id,
+                    previous.c.group_id == validated_group_id
+                )
+                .scalar_subquery()
+                .label('was_active')
             )
-            
-            if existing_mappings:
-                # Reactivate existing mapping
-                mapping_record = existing_mappings[0]
-                mapping_id = mapping_record.id
-                
-                if mapping_record.is_active:
-                    return {
-                        'success': True,
-                        'action': 'already_active',
-                        'mapping': dict(mapping_record._mapping),
-                        'message': f"User {validated_user_id} is already active in group {validated_group_id}"
-                    }
-                
-                # Reactivate the mapping
-                result = update_user_group_mapping(
-                    mapping_id=mapping_id,
-                    update_data={'is_active': True}
+            stmt = (
+                pg_insert(mapper_table)
+                .values(user_id=validated_user_id, group_id=validated_group_id, is_active=True)
+                .on_conflict_do_update(
+                    index_elements=['user_id', 'group_id'],
+                    set_={'is_active': True}
                 )
-                
-                return {
-                    'success': True,
-                    'action': 'reactivated',
-                    'mapping': result['mapping'],
-                    'operation_summary': {
-                        'user_id': validated_user_id,
-                        'group_id': validated_group_id,
-                        'mapping_id': mapping_id,
-                        'action': 'reactivated'
-                    },
-                    'message': f"Successfully reactivated user {validated_user_id} in group {validated_group_id}"
-                }
-            else:
-                # Create new mapping
-                result = create_user_group_mapping({
-                    'user_id': validated_user_id,
-                    'group_id': validated_group_id,
-                    'is_active': True
-                })
-                
-                return {
-                    'success': True,
-                    'action': 'created',
-                    'mapping': result['mapping'],
-                    'operation_summary': {
-                        'user_id': validated_user_id,
-                        'group_id': validated_group_id,
-                        'mapping_id': result['mapping']['id'],
-                        'action': 'created'
-                    },
-                    'message': f"Successfully created new mapping for user {validated_user_id} in group {validated_group_id}"
-                }
-                
-    except SQLAlchemyReadError as e:
-        raise UserGroupMapperError(f"Database error checking mapping: {e}") from e
-    except (UserGroupValidationError, UserGroupMapperError, UserGroupNotFoundError):
-        raise
+                .returning(*mapper_table.c, was_active)
+            )
+            
+            [upserted_row] = db.execute_transaction([lambda conn: conn.execute(stmt).fetchone()])
+            
+    except SQLAlchemyError as e:
+        constraint = _violated_foreign_key(e)
+        if constraint is not None:
+            if 'group_id' in constraint:
+                raise UserGroupNotFoundError(
+                    f"User group with ID {validated_group_id} not found"
+                ) from e
+            raise UserGroupMapperError(f"User with ID {validated_user_id} not found") from e
+        raise UserGroupMapperError(f"Database error activating mapping: {e}") from e
     except Exception as e:
-        raise UserGroupMapperError(f"Unexpected error activating mapping: {e}") from e
\ No newline at end of file
+        raise UserGroupMapperError(f"Unexpected error activating mapping: {e}") from e
+    
+    mapping = dict(upserted_row._mapping)
+    previous_is_active = mapping.pop('was_active')
+    
+    if previous_is_active:
+        return {
+            'success': True,
+            'action': 'already_active',
+            'mapping': mapping,
+            'message': f"User {validated_user_id} is already active in group {validated_group_id}"
+        }
+    
+    if previous_is_active is None:
+        action = 'created'
+        message = f"Successfully created new mapping for user {validated_user_id} in group {validated_group_id}"
+    else:
+        action = 'reactivated'
+        message = f"Successfully reactivated user {validated_user_id} in group {validated_group_id}"
+    
+    return {
+        'success': True,
+        'action': action,
+        'mapping': mapping,
+        'operation_summary': {
+            'user_id': validated_user_id,
+            'group_id': validated_group_id,
+            'mapping_id': mapping['id'],
+            'action': action
+        },
+        'message': message
+    }
\ No newline at end of file
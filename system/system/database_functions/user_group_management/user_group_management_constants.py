@@ -7,7 +7,19 @@ including table names and error messages.
 # Table names - using constants for better maintainability
 USER_GROUPS_TABLE = 'user_groups'
 USER_GROUP_MAPPER_TABLE = 'user_group_mapper'
+USERS_TABLE = 'users'
+
+# PostgreSQL SQLSTATE raised when a foreign key reference is missing
+PG_FOREIGN_KEY_VIOLATION = '23503'
+
+# Concurrency limits - kept below the engine connection pool size
+BATCH_SUMMARY_MAX_WORKERS = 8
 
 # Error message constants
 MAPPING_ID_POSITIVE_ERROR = "Mapping ID must be a positive integer"
-MAPPING_ID_INTEGER_ERROR = "Mapping ID must be a valid integer"
\ No newline at end of file
+MAPPING_ID_INTEGER_ERROR = "Mapping ID must be a valid integer"
+
+# Response message templates (filled with str.format)
+MAPPING_CREATED_MESSAGE = "Successfully created mapping between user {user_id} and group {group_id}"
+MAPPING_UPDATED_MESSAGE = "Successfully updated mapping between user {user_id} and group {group_id}"
+MAPPING_DELETED_MESSAGE = "Successfully deleted mapping between user {user_id} and {group_name}"
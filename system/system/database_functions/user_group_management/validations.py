@@ -5,17 +5,23 @@ management operations, including user groups, user-group mappings, and related
 operations with comprehensive field validation and business rules.
 """
 
+import functools
 import re
-from typing import List, Optional
+from collections import Counter
+from typing import Annotated, Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 from pydantic import (
     BaseModel, 
     Field, 
     field_validator, 
-    ConfigDict
+    ConfigDict,
+    TypeAdapter,
+    ValidationError as PydanticValidationError,
 )
+from typing_extensions import TypedDict
 
 # Import from database_functions for now, but this should be moved to a central location
+from system.system.database_functions.exceptions import UserGroupValidationError
 
 # User Group validation constants
 GROUP_NAME_EMPTY_ERROR = "Group name cannot be empty"
@@ -23,6 +29,27 @@ GROUP_NAME_FORMAT_ERROR = "Group name can only contain letters, numbers, spaces,
 GROUP_NAME_LENGTH_ERROR = "Group name must be between 1 and 100 characters"
 USER_ID_INVALID_ERROR = "User ID must be a positive integer"
 GROUP_ID_INVALID_ERROR = "Group ID must be a positive integer"
+SEARCH_TERM_EMPTY_ERROR = "Search term cannot be empty"
+
+# Prefixes for wrapped Pydantic validation errors
+_GROUP_CREATE_FAILED_PREFIX = "Group creation validation failed: "
+_GROUP_UPDATE_FAILED_PREFIX = "Group update validation failed: "
+_BULK_GROUP_UPDATE_FAILED_PREFIX = "Bulk group update validation failed: "
+_SEARCH_FAILED_PREFIX = "Search validation failed: "
+_GROUP_FILTERS_FAILED_PREFIX = "Group filter validation failed: "
+_MAPPING_CREATE_FAILED_PREFIX = "Mapping validation failed: "
+_MAPPING_UPDATE_FAILED_PREFIX = "Mapping update validation failed: "
+_BULK_MAPPING_CREATE_FAILED_PREFIX = "Bulk mapping validation failed: "
+
+# Largest batch accepted by bulk mapping creation; all rows go into one
+# INSERT, whose bind parameters PostgreSQL caps at 65535
+MAX_BULK_MAPPINGS = 1000
+
+# Fields searched when the caller does not specify any
+DEFAULT_SEARCH_FIELDS = ('group_name', 'description')
+
+# Group names can contain letters, numbers, spaces, underscores, and hyphens
+_GROUP_NAME_RE = re.compile(r'^[a-zA-Z0-9\s_-]+$')
 
 
 class UserGroupBase(BaseModel):
@@ -73,7 +100,7 @@ class UserGroupBase(BaseModel):
             raise ValueError(GROUP_NAME_LENGTH_ERROR)
         
         # Group names can contain letters, numbers, spaces, underscores, and hyphens
-        if not re.match(r'^[a-zA-Z0-9\s_-]+$', v):
+        if not _GROUP_NAME_RE.match(v):
             raise ValueError(GROUP_NAME_FORMAT_ERROR)
             
         return v.strip()  # Return trimmed name
@@ -135,7 +162,7 @@ class UserGroupUpdate(BaseModel):
             if len(v) > 100:
                 raise ValueError(GROUP_NAME_LENGTH_ERROR)
             
-            if not re.match(r'^[a-zA-Z0-9\s_-]+$', v):
+            if not _GROUP_NAME_RE.match(v):
                 raise ValueError(GROUP_NAME_FORMAT_ERROR)
                 
             return v.strip()
@@ -316,6 +343,36 @@ class UserGroupMapperUpdate(BaseModel):
         return v
 
 
+class UserGroupActivation(TypedDict):
+    """Validated parameters for activating a user in a group.
+    
+    Describes the shape returned by ``validate_user_group_activation``, which
+    checks the two IDs inline rather than through Pydantic.
+    
+    Attributes:
+        user_id: ID of the user to activate
+        group_id: ID of the group to activate the user in
+    """
+    
+    user_id: Annotated[int, Field(gt=0, description="User ID (positive integer)")]
+    group_id: Annotated[int, Field(gt=0, description="Group ID (positive integer)")]
+
+
+class PaginationParams(TypedDict):
+    """Validated pagination parameters.
+    
+    Describes the shape returned by ``validate_pagination_params``, which
+    checks the two values inline rather than through Pydantic.
+    
+    Attributes:
+        limit: Maximum number of records to return (None for no limit)
+        offset: Number of records to skip
+    """
+    
+    limit: Optional[Annotated[int, Field(gt=0, description="Maximum number of records")]]
+    offset: Annotated[int, Field(ge=0, description="Number of records to skip")]
+
+
 class UserGroupMapperResponse(UserGroupMapperBase):
     """Pydantic model for user-group mapping response data.
     
@@ -402,6 +459,95 @@ class UserGroupSearch(BaseModel):
     )
 
 
+class UserGroupFilters(BaseModel):
+    """Pydantic model for equality filters on the user groups table.
+    
+    Unknown keys are rejected so a typo cannot silently widen a query.
+    
+    Attributes:
+        id: Optional group ID filter
+        group_name: Optional exact group name filter
+        is_active: Optional active status filter
+    """
+    
+    model_config = ConfigDict(extra='forbid')
+    
+    id: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Filter by group ID"
+    )
+    group_name: Optional[str] = Field(
+        default=None,
+        min_length=1,
+        max_length=100,
+        description="Filter by exact group name"
+    )
+    is_active: Optional[bool] = Field(
+        default=None,
+        description="Filter by active status"
+    )
+
+
+class UserGroupSearchParams(BaseModel):
+    """Pydantic model for free-text user group search parameters.
+    
+    Applies defaults and validation in a single pass.
+    
+    Attributes:
+        search_term: Term to search for (stripped and lowercased)
+        search_fields: Fields to search in
+        limit: Maximum number of results to return
+    """
+    
+    search_term: str = Field(
+        ...,
+        description="Term to search for"
+    )
+    search_fields: Tuple[str, ...] = Field(
+        default=DEFAULT_SEARCH_FIELDS,
+        description="Fields to search in"
+    )
+    limit: int = Field(
+        default=50,
+        gt=0,
+        le=1000,
+        description="Maximum number of results (1-1000)"
+    )
+
+    @field_validator('search_term')
+    @classmethod
+    def validate_search_term(cls, v: str) -> str:
+        """Validate and normalise the search term.
+        
+        Args:
+            v: The search term to validate
+            
+        Returns:
+            str: Stripped, lowercased search term
+            
+        Raises:
+            ValueError: If the search term is empty
+        """
+        v = v.strip()
+        if not v:
+            raise ValueError(SEARCH_TERM_EMPTY_ERROR)
+        return v.lower()
+
+    @field_validator('search_fields', mode='before')
+    @classmethod
+    def default_search_fields(cls, v: Any) -> Any:
+        """Fall back to the default fields when none are given.
+        
+        Args:
+            v: The raw search fields value
+            
+        Returns:
+            Any: The default fields if ``v`` is empty, otherwise ``v``
+        """
+        return v or DEFAULT_SEARCH_FIELDS
+
+
 class BulkUserGroupOperation(BaseModel):
     """Pydantic model for bulk user-group operations.
     
@@ -479,6 +625,281 @@ class BulkUserGroupOperation(BaseModel):
         return unique_ids
 
 
+class UserGroupBulkUpdateItem(BaseModel):
+    """Pydantic model for a single item of a bulk user group update.
+    
+    Attributes:
+        group_id: ID of the group to update
+        data: Dictionary of fields to update on the group
+    """
+    
+    group_id: int = Field(
+        ...,
+        description="ID of the group to update"
+    )
+    data: Dict[str, Any] = Field(
+        ...,
+        description="Fields to update on the group"
+    )
+
+
+def _dump_flat(model: BaseModel, exclude_none: bool = False) -> Dict[str, Any]:
+    """Copy a flat model's field values into a dict without the serializer.
+    
+    Equivalent to ``model_dump()`` for models whose fields are plain scalars
+    with no aliases, computed fields or nested models, such as the mapper
+    models; it skips the round trip into pydantic-core.
+    
+    Args:
+        model: Validated model instance
+        exclude_none: Whether to drop fields whose value is None
+        
+    Returns:
+        Dict[str, Any]: Field values keyed by field name
+    """
+    if exclude_none:
+        return {key: value for key, value in model.__dict__.items() if value is not None}
+    return dict(model.__dict__)
+
+
+# Built once at import so every bulk call validates the whole list in a single pass
+_BULK_GROUP_UPDATE_ADAPTER = TypeAdapter(List[UserGroupBulkUpdateItem])
+
+
+# Mapping adapters, likewise built once and shared by every call
+_BULK_MAPPING_CREATE_ADAPTER = TypeAdapter(List[UserGroupMapperCreate])
+
+
+def validate_bulk_group_update_data(group_updates: List[Dict[str, Any]]) -> List[UserGroupBulkUpdateItem]:
+    """Validate the items of a bulk user group update in one call.
+    
+    Args:
+        group_updates: List of dictionaries with 'group_id' and 'data' keys
+        
+    Returns:
+        List[UserGroupBulkUpdateItem]: Validated update items
+        
+    Raises:
+        UserGroupValidationError: If any item is malformed
+    """
+    try:
+        return _BULK_GROUP_UPDATE_ADAPTER.validate_python(group_updates)
+    except PydanticValidationError as e:
+        raise UserGroupValidationError(_BULK_GROUP_UPDATE_FAILED_PREFIX, e) from None
+
+
+def validate_search_params(search_term: str, search_fields: Optional[List[str]] = None,
+                           limit: int = 50) -> UserGroupSearchParams:
+    """Validate free-text search parameters.
+    
+    Args:
+        search_term: Term to search for
+        search_fields: Fields to search in (default: DEFAULT_SEARCH_FIELDS)
+        limit: Maximum number of results
+        
+    Returns:
+        UserGroupSearchParams: Validated search parameters
+        
+    Raises:
+        UserGroupValidationError: If validation fails
+    """
+    try:
+        return UserGroupSearchParams(
+            search_term=search_term, search_fields=search_fields, limit=limit
+        )
+    except PydanticValidationError as e:
+        raise UserGroupValidationError(_SEARCH_FAILED_PREFIX, e) from None
+
+
+def _make_validator(model_cls: type, error_prefix: str, exclude_none: bool = False,
+                    require_fields: bool = False) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """Build a ``validate_*`` function for a flat Pydantic model.
+    
+    The returned function validates a dict through a TypeAdapter built once
+    here, returns the validated fields as a dict and wraps Pydantic errors in
+    UserGroupValidationError.
+    
+    Args:
+        model_cls: Pydantic model to validate against
+        error_prefix: Prefix for the UserGroupValidationError message
+        exclude_none: Whether to drop fields left as None (partial updates)
+        require_fields: Whether to reject input that sets no fields at all
+        
+    Returns:
+        Callable[[Dict[str, Any]], Dict[str, Any]]: The validator
+    """
+    adapter = TypeAdapter(model_cls)
+    
+    def validate(data: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            validated = _dump_flat(adapter.validate_python(data), exclude_none=exclude_none)
+        except PydanticValidationError as e:
+            raise UserGroupValidationError(error_prefix, e) from None
+        
+        if require_fields and not validated:
+            raise UserGroupValidationError("Update data cannot be empty")
+        return validated
+    
+    return validate
+
+
+# Single-model validators: each takes the raw dict and returns validated
+# fields, raising UserGroupValidationError on invalid input
+validate_group_create_data = _make_validator(UserGroupCreate, _GROUP_CREATE_FAILED_PREFIX)
+validate_group_update_data = _make_validator(
+    UserGroupUpdate, _GROUP_UPDATE_FAILED_PREFIX, exclude_none=True, require_fields=True
+)
+validate_mapping_create_data = _make_validator(UserGroupMapperCreate, _MAPPING_CREATE_FAILED_PREFIX)
+validate_mapping_update_data = _make_validator(
+    UserGroupMapperUpdate, _MAPPING_UPDATE_FAILED_PREFIX, exclude_none=True, require_fields=True
+)
+_validate_group_filters_uncached = _make_validator(
+    UserGroupFilters, _GROUP_FILTERS_FAILED_PREFIX, exclude_none=True
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _validate_frozen_group_filters(frozen_filters: Tuple[Tuple[str, Any], ...]) -> Tuple[Tuple[str, Any], ...]:
+    """Validate group filters given as sorted (key, value) pairs, caching the result."""
+    return tuple(_validate_group_filters_uncached(dict(frozen_filters)).items())
+
+
+def validate_group_filters(filters: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate equality filters for reading user groups.
+    
+    List endpoints send the same few filter dicts over and over, so results
+    are cached on the sorted (key, value) pairs; filters with unhashable
+    values are validated without the cache.
+    
+    Args:
+        filters: Column filters (e.g. {'is_active': True})
+        
+    Returns:
+        Dict[str, Any]: Validated filters, without keys left as None
+        
+    Raises:
+        UserGroupValidationError: If a key is unknown or a value is invalid
+    """
+    try:
+        frozen_filters = tuple(sorted(filters.items()))
+        hash(frozen_filters)
+    except TypeError:
+        return _validate_group_filters_uncached(filters)
+    # A fresh dict each call, so callers cannot mutate the cached entry
+    return dict(_validate_frozen_group_filters(frozen_filters))
+
+
+def validate_bulk_mapping_create_data(mappings_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Validate the mappings of a bulk create in one call.
+    
+    Args:
+        mappings_data: List of dictionaries with 'user_id', 'group_id' and
+            optional 'is_active'
+        
+    Returns:
+        List[Dict[str, Any]]: Validated mapping data, in input order
+        
+    Raises:
+        UserGroupValidationError: If the list is empty or longer than
+            MAX_BULK_MAPPINGS, any item is invalid or a (user_id, group_id)
+            pair appears more than once
+    """
+    if not mappings_data:
+        raise UserGroupValidationError("Mapping list cannot be empty")
+    if len(mappings_data) > MAX_BULK_MAPPINGS:
+        raise UserGroupValidationError(
+            f"Cannot create more than {MAX_BULK_MAPPINGS} mappings at once"
+        )
+    
+    try:
+        mappings = _BULK_MAPPING_CREATE_ADAPTER.validate_python(mappings_data)
+    except PydanticValidationError as e:
+        raise UserGroupValidationError(_BULK_MAPPING_CREATE_FAILED_PREFIX, e) from None
+    
+    # Cheap set-size check first; only count pairs to name a duplicate
+    pairs = [(mapping.user_id, mapping.group_id) for mapping in mappings]
+    if len(set(pairs)) != len(pairs):
+        duplicate = next(pair for pair, count in Counter(pairs).items() if count > 1)
+        raise UserGroupValidationError(
+            f"Duplicate user-group combination: user {duplicate[0]}, group {duplicate[1]}"
+        )
+    
+    return [_dump_flat(mapping) for mapping in mappings]
+
+
+def validate_user_group_activation(user_id: Any, group_id: Any) -> UserGroupActivation:
+    """Validate the parameters of a user activation in a group.
+    
+    Args:
+        user_id: The user ID
+        group_id: The group ID
+        
+    Returns:
+        UserGroupActivation: Dict with validated 'user_id' and 'group_id'
+        
+    Raises:
+        UserGroupValidationError: If either ID is invalid
+    """
+    return {
+        'user_id': validate_positive_integer(user_id, "User ID"),
+        'group_id': validate_positive_integer(group_id, "Group ID")
+    }
+
+
+def validate_pagination_params(limit: Optional[int] = None, offset: int = 0) -> PaginationParams:
+    """Validate pagination parameters.
+    
+    Args:
+        limit: Maximum number of records to return (None for no limit)
+        offset: Number of records to skip
+        
+    Returns:
+        PaginationParams: Dict with validated 'limit' and 'offset'
+        
+    Raises:
+        UserGroupValidationError: If limit is not positive or offset is negative
+    """
+    if limit is not None:
+        limit = validate_positive_integer(limit, "Limit")
+    
+    if type(offset) is not int:
+        try:
+            offset = int(offset)
+        except (ValueError, TypeError) as e:
+            raise UserGroupValidationError(f"Offset must be a valid integer: {e}") from None
+    if offset < 0:
+        raise UserGroupValidationError("Offset must be non-negative")
+    
+    return {'limit': limit, 'offset': offset}
+
+
+def validate_positive_integer(value: Any, field_name: str = "ID") -> int:
+    """Validate and convert an ID-like value to a positive integer.
+    
+    Args:
+        value: The value to validate (int, numeric str, etc.)
+        field_name: Name used in error messages (e.g. "Group ID")
+        
+    Returns:
+        int: Validated positive integer
+        
+    Raises:
+        UserGroupValidationError: If the value is not a positive integer
+    """
+    # Fast path: IDs coming from the database or other validators are ints
+    if type(value) is int and value > 0:
+        return value
+    
+    try:
+        value = int(value)
+    except (ValueError, TypeError) as e:
+        raise UserGroupValidationError(f"{field_name} must be a valid integer: {e}") from None
+    
+    if value <= 0:
+        raise UserGroupValidationError(f"{field_name} must be a positive integer")
+    return value
+
+
 def validate_group_id(group_id: any) -> int:
     """Validate and convert group ID to integer.
     
@@ -34,12 +34,13 @@ Example:
     ...     print(f"Found {len(users)} users")
 """
 
-from contextlib import contextmanager
-from typing import Dict, List, Optional, Any, Generator
+from contextlib import nullcontext
+from typing import ContextManager, Dict, List, Optional, Any
 
+from cachelib import SimpleCache
 from sqlalchemy.exc import SQLAlchemyError
 
-from system.system.database_connections.pg_db import PostgresDB
+from system.system.database_connections.pg_db import PostgresDB, get_session
 from system.system.database_functions.exceptions import (
     UserNotFoundError,
     UserCreateError,
@@ -51,6 +52,9 @@ from system.system.database_functions.user_management.user_management_constants
     USER_ALREADY_EXISTS,
     USER_NOT_FOUND,
     USERS_TABLE,
+    USER_SEARCH_FIELDS,
+    USER_CACHE_THRESHOLD,
+    USER_CACHE_TIMEOUT,
 )
 from system.system.database_functions.user_management.validations import (
     UserCreate,
@@ -58,6 +62,32 @@ from system.system.database_functions.user_management.validations import (
 )
 
 
+# Process-wide cache of user lookups, shared by every UserManager instance.
+# Entries written by this process are invalidated on change; anything else
+# expires after USER_CACHE_TIMEOUT seconds.
+_user_cache = SimpleCache(threshold=USER_CACHE_THRESHOLD, default_timeout=USER_CACHE_TIMEOUT)
+
+
+def _id_cache_key(user_id: int) -> str:
+    """Build the cache key of a lookup by user ID."""
+    return f"id:{user_id}"
+
+
+def _email_cache_key(email: str) -> str:
+    """Build the cache key of a lookup by canonical email (username)."""
+    return f"email:{email}"
+
+
+def _canonical_email(email: str) -> str:
+    """Normalise an email the way UserBase stores usernames (trimmed, lowercase)."""
+    return email.strip().lower()
+
+
+def _invalidate_cached_user(user: Dict[str, Any]) -> None:
+    """Drop the cached lookups of a user that was changed or removed."""
+    _user_cache.delete_many(_id_cache_key(user['id']), _email_cache_key(user['username']))
+
+
 class UserManager:
     """Object-oriented user management class for database operations.
     
@@ -67,8 +97,8 @@ class UserManager:
     handling and validation.
     
     Attributes:
-        _db_connection: Optional PostgresDB connection instance
-        _auto_close: Whether to automatically close connections
+        _db_connection: Reference to the shared PostgresDB instance when
+                        persistent_connection is set
         
     Examples:
         >>> # Basic usage
@@ -102,43 +132,36 @@ class UserManager:
         """Initialize the UserManager.
         
         Args:
-            persistent_connection: If True, maintains a persistent database 
-                                  connection. If False, creates new connections 
-                                  for each operation.
+            persistent_connection: If True, holds a reference to the shared
+                                  PostgresDB instance for the lifetime of the
+                                  manager. Operations always draw connections
+                                  from the shared engine pool either way.
                                  
         Example:
-            >>> # Standard usage (new connection per operation)
+            >>> # Standard usage (pooled connection per operation)
             >>> user_manager = UserManager()
             >>> 
-            >>> # Persistent connection for better performance with multiple operations
+            >>> # Keep a reference to the shared instance
             >>> user_manager = UserManager(persistent_connection=True)
         """
         self._db_connection: Optional[PostgresDB] = None
         self._persistent_connection = persistent_connection
-        self._auto_close = True
         
         if persistent_connection:
             self._db_connection = PostgresDB()
-            self._auto_close = False
 
-    @contextmanager
-    def _get_db_connection(self) -> Generator[PostgresDB, None, None]:
-        """Provide a transactional scope around a series of operations.
+    def _get_db_connection(self) -> ContextManager[PostgresDB]:
+        """Provide the shared database instance for a series of operations.
         
-        This internal method handles connection management based on the
-        persistent_connection setting.
+        PostgresDB is a process-wide singleton whose operations each check a
+        connection out of the engine's pool and return it when done, so
+        nothing is opened here and nothing is closed afterwards. Closing the
+        instance would dispose the whole pool for every caller.
         
-        Yields:
-            PostgresDB: An active database connection instance
+        Returns:
+            ContextManager[PostgresDB]: Context yielding the shared PostgresDB instance
         """
-        if self._persistent_connection and self._db_connection:
-            yield self._db_connection
-        else:
-            db = PostgresDB()
-            try:
-                yield db
-            finally:
-                db.close()
+        return nullcontext(get_session())
 
     def _validate_user_id(self, user_id: int) -> None:
         """Validate that user_id is a positive integer.
@@ -152,16 +175,32 @@ class UserManager:
         if not isinstance(user_id, int) or user_id <= 0:
             raise ValueError("User ID must be a positive integer")
 
-    def create_user(self, user_data: Dict[str, Any], join: int = 0) -> Dict[str, Any]:
+    def _validate_user_ids(self, user_ids: List[int]) -> None:
+        """Validate that every user ID is a positive integer.
+        
+        Args:
+            user_ids: The user IDs to validate
+            
+        Raises:
+            ValueError: If any user ID is not a positive integer
+        """
+        if not all(isinstance(user_id, int) and user_id > 0 for user_id in user_ids):
+            raise ValueError("User ID must be a positive integer")
+
+    def create_user(self, user_data: Dict[str, Any], join: int = 0, validated: bool = False) -> Dict[str, Any]:
         """Create a new user in the database.
         
-        Validates the user data and creates a new user record. Checks for existing
-        users with the same email to prevent duplicates.
+        Validates the user data and creates a new user record. The insert uses
+        ON CONFLICT DO NOTHING on the unique username (email) column, so the
+        duplicate check and the insert happen atomically in one statement.
         
         Args:
             user_data: Dictionary containing user information (email and name required)
-            join: Join control parameter (0=no joins, 1=forward joins, 
-                  -1=backward joins)
+            join: Unused; kept for backward compatibility
+            validated: If True, user_data comes from a trusted caller that has
+                       already validated it, and Pydantic validation is skipped
+                       (model defaults still apply and the username is still
+                       canonicalised, so email lookups can find the user)
             
         Returns:
             Dictionary containing the created user data with database-generated fields
@@ -182,33 +221,37 @@ class UserManager:
             >>> print(new_user["email"])
             alice@example.com
         """
-        validated_data = UserCreate(**user_data)
+        if validated:
+            validated_data = UserCreate.model_construct(**user_data)
+            validated_data.username = _canonical_email(validated_data.username)
+        else:
+            validated_data = UserCreate(**user_data)
+        create_data = {
+            field: value for field, value in validated_data.__dict__.items()
+            if field != 'confirm_passwd'
+        }
         try:
             with self._get_db_connection() as db:
-                # Check if user already exists
-                existing_users = db.read(
-                    USERS_TABLE, 
-                    {'email': validated_data.email}, 
-                    join=join
+                # Insert unless a user with this username already exists
+                created_user = db.create_on_conflict_nothing(
+                    USERS_TABLE,
+                    create_data,
+                    ['username']
                 )
-                if existing_users:
+                if created_user is None:
                     raise UserAlreadyExistsException(USER_ALREADY_EXISTS)
-                
-                # Create the user
-                created_user = db.create(USERS_TABLE, validated_data.model_dump())
-                if created_user:
-                    return dict(created_user._mapping)
-                else:
-                    raise UserCreateError("Failed to create user")
+                return dict(created_user._mapping)
         except SQLAlchemyError as exc:
             raise UserCreateError(str(exc)) from exc
 
-    def get_user_by_id(self, user_id: int, join: int = 0) -> Dict[str, Any]:
+    def get_user_by_id(self, user_id: int, join: int = 0, cache: bool = True) -> Dict[str, Any]:
         """Retrieve a user by their ID.
         
         Args:
             user_id: The unique identifier of the user
             join: Join control parameter (0=no joins, 1=forward joins, -1=backward joins)
+            cache: Whether a cached lookup (at most USER_CACHE_TIMEOUT seconds
+                   old) may be returned; pass False for a fresh read
             
         Returns:
             Dictionary containing the user data
@@ -231,22 +274,36 @@ class UserManager:
         # Validate user_id is a positive integer
         if not isinstance(user_id, int) or user_id <= 0:
             raise ValueError("User ID must be a positive integer")
+        
+        use_cache = cache and not join
+        if use_cache:
+            user = _user_cache.get(_id_cache_key(user_id))
+            if user is not None:
+                return user
             
         try:
             with self._get_db_connection() as db:
                 users = db.read(USERS_TABLE, {'id': user_id}, join=join)
                 if not users:
                     raise UserNotFoundError(USER_NOT_FOUND)
-                return dict(users[0]._mapping)
+                user = dict(users[0]._mapping)
+                if use_cache:
+                    _user_cache.set(_id_cache_key(user_id), user)
+                return user
         except SQLAlchemyError as exc:
             raise UserNotFoundError(str(exc)) from exc
 
-    def get_user_by_email(self, email: str, join: int = 0) -> Optional[Dict[str, Any]]:
+    def get_user_by_email(self, email: str, join: int = 0, cache: bool = True) -> Optional[Dict[str, Any]]:
         """Retrieve a user by their email address.
         
+        The email is trimmed and lowercased, matching how usernames are
+        stored, so lookups are case-insensitive and use the username index.
+        
         Args:
             email: The email address of the user
             join: Join control parameter (0=no joins, 1=forward joins, -1=backward joins)
+            cache: Whether a cached lookup (at most USER_CACHE_TIMEOUT seconds
+                   old) may be returned; pass False for a fresh read
             
         Returns:
             Dictionary containing the user data or None if not found
@@ -261,24 +318,41 @@ class UserManager:
         """
         if not email or not isinstance(email, str):
             raise ValueError("Email must be a non-empty string")
+        email = _canonical_email(email)
+        
+        use_cache = cache and not join
+        if use_cache:
+            user = _user_cache.get(_email_cache_key(email))
+            if user is not None:
+                return user
             
         try:
             with self._get_db_connection() as db:
-                users = db.read(USERS_TABLE, {'email': email}, join=join)
-                return dict(users[0]._mapping) if users else None
+                users = db.read(USERS_TABLE, {'username': email}, join=join)
+                if not users:
+                    return None
+                user = dict(users[0]._mapping)
+                if use_cache:
+                    _user_cache.set(_email_cache_key(email), user)
+                return user
         except SQLAlchemyError as exc:
             raise UserNotFoundError(str(exc)) from exc
 
-    def update_user(self, user_id: int, update_data: Dict[str, Any], join: int = 0) -> Dict[str, Any]:
+    def update_user(self, user_id: int, update_data: Dict[str, Any], join: int = 0, validated: bool = False) -> Dict[str, Any]:
         """Update an existing user's information.
         
         Performs partial updates - only provided fields will be modified.
-        Validates the user exists before attempting the update.
+        The UPDATE returns the modified row, so a missing user is detected
+        without a separate existence check. Only a username (email) change
+        reads the current username first, to invalidate its cached lookup.
         
         Args:
             user_id: The unique identifier of the user to update
             update_data: Dictionary containing fields to update
-            join: Join control parameter (0=no joins, 1=forward joins, -1=backward joins)
+            join: Unused; kept for backward compatibility
+            validated: If True, update_data comes from a trusted caller that has
+                       already validated it, and is written as given apart from
+                       canonicalising a username
             
         Returns:
             Dictionary containing the updated user data
@@ -303,31 +377,42 @@ class UserManager:
             >>> updated_user = user_manager.update_user(1, update_data)
         """
         self._validate_user_id(user_id)
-        validated_data = UserUpdate(**update_data)
+        if validated:
+            changes = dict(update_data)
+            if changes.get('username') is not None:
+                changes['username'] = _canonical_email(changes['username'])
+        else:
+            changes = UserUpdate(**update_data).model_dump(exclude_unset=True)
         try:
             with self._get_db_connection() as db:
-                # Check if user exists
-                users = db.read(USERS_TABLE, {'id': user_id}, join=join)
-                if not users:
-                    raise UserNotFoundError(USER_NOT_FOUND)
+                previous_username = None
+                if 'username' in changes:
+                    # The old email's cached lookup must go too, so read it first
+                    current = db.read_mappings(USERS_TABLE, {'id': user_id}, columns=['username'], limit=1)
+                    if not current:
+                        raise UserNotFoundError(USER_NOT_FOUND)
+                    previous_username = current[0]['username']
                 
-                # Update the user
-                updated_users = db.update(USERS_TABLE, validated_data.model_dump(exclude_unset=True), {'id': user_id})
-                if updated_users:
-                    return dict(updated_users[0]._mapping)
-                else:
-                    raise UserUpdateError("Failed to update user")
+                updated_users = db.update(USERS_TABLE, changes, {'id': user_id})
+                if not updated_users:
+                    raise UserNotFoundError(USER_NOT_FOUND)
+                updated_user = dict(updated_users[0]._mapping)
+                _invalidate_cached_user(updated_user)
+                if previous_username is not None:
+                    _user_cache.delete(_email_cache_key(previous_username))
+                return updated_user
         except SQLAlchemyError as exc:
             raise UserUpdateError(str(exc)) from exc
 
     def delete_user(self, user_id: int, join: int = 0) -> bool:
         """Delete a user by their ID.
         
-        Validates the user exists before attempting deletion.
+        A missing user is detected from the rows the DELETE returns, without
+        a separate existence check.
         
         Args:
             user_id: The unique identifier of the user to delete
-            join: Join control parameter for existence check
+            join: Unused; kept for backward compatibility
             
         Returns:
             True if user was deleted successfully
@@ -351,13 +436,10 @@ class UserManager:
         self._validate_user_id(user_id)
         try:
             with self._get_db_connection() as db:
-                # Check if user exists
-                users = db.read(USERS_TABLE, {'id': user_id}, join=join)
-                if not users:
+                deleted_users = db.delete(USERS_TABLE, {'id': user_id}, returning=True)
+                if not deleted_users:
                     raise UserNotFoundError(USER_NOT_FOUND)
-                
-                # Delete the user
-                db.delete(USERS_TABLE, {'id': user_id})
+                _invalidate_cached_user(deleted_users[0]._mapping)
                 return True
         except SQLAlchemyError as exc:
             raise UserDeleteError(str(exc)) from exc
@@ -365,12 +447,12 @@ class UserManager:
     def delete_users_bulk(self, user_ids: List[int], join: int = 0) -> int:
         """Delete multiple users by their IDs.
         
-        Processes deletions individually and counts successful deletions.
+        Issues a single DELETE for all IDs and counts the rows it removed.
         Non-existing users are silently skipped.
         
         Args:
             user_ids: List of user IDs to delete
-            join: Join control parameter for existence checks
+            join: Unused; kept for backward compatibility
             
         Returns:
             Number of users successfully deleted
@@ -389,18 +471,14 @@ class UserManager:
         if not user_ids:
             return 0
         
-        for user_id in user_ids:
-            self._validate_user_id(user_id)
+        self._validate_user_ids(user_ids)
             
         try:
             with self._get_db_connection() as db:
-                deleted_count = 0
-                for user_id in user_ids:
-                    users = db.read(USERS_TABLE, {'id': user_id}, join=join)
-                    if users:
-                        db.delete(USERS_TABLE, {'id': user_id})
-                        deleted_count += 1
-                return deleted_count
+                deleted_users = db.delete_in(USERS_TABLE, 'id', user_ids, returning_columns=['id', 'username'])
+                for deleted_user in deleted_users:
+                    _invalidate_cached_user(deleted_user._mapping)
+                return len(deleted_users)
         except SQLAlchemyError as exc:
             raise UserDeleteError(str(exc)) from exc
 
@@ -408,11 +486,12 @@ class UserManager:
         """Delete multiple users with detailed operation results.
         
         Provides comprehensive information about the deletion operation including
-        which users were found, deleted, or missing.
+        which users were found, deleted, or missing. A single DELETE ... RETURNING
+        both removes the users and reports which IDs existed.
         
         Args:
             user_ids: List of user IDs to delete
-            join: Join control parameter for existence checks
+            join: Unused; kept for backward compatibility
             
         Returns:
             Dictionary containing detailed deletion results:
@@ -449,29 +528,21 @@ class UserManager:
             }
         
         # Validate all user IDs first
-        for user_id in user_ids:
-            self._validate_user_id(user_id)
+        self._validate_user_ids(user_ids)
         
         try:
             with self._get_db_connection() as db:
-                # Find all existing users with the provided IDs
-                existing_user_ids = []
-                for user_id in user_ids:
-                    users = db.read(USERS_TABLE, {'id': user_id}, join=join)
-                    if users:
-                        existing_user_ids.append(user_id)
+                # Delete in one statement; the returned IDs are the ones that existed
+                deleted_users = db.delete_in(USERS_TABLE, 'id', user_ids, returning_columns=['id', 'username'])
+                for deleted_user in deleted_users:
+                    _invalidate_cached_user(deleted_user._mapping)
+                deleted_ids = {deleted_user.id for deleted_user in deleted_users}
                 
                 # Determine which IDs don't exist
-                non_existing_ids = [user_id for user_id in user_ids if user_id not in existing_user_ids]
-                
-                # Delete the existing users
-                deleted_count = 0
-                for user_id in existing_user_ids:
-                    db.delete(USERS_TABLE, {'id': user_id})
-                    deleted_count += 1
+                non_existing_ids = [user_id for user_id in user_ids if user_id not in deleted_ids]
                 
                 return {
-                    'deleted_count': deleted_count,
+                    'deleted_count': len(deleted_ids),
                     'non_existing_ids': non_existing_ids,
                     'non_existing_count': len(non_existing_ids),
                     'total_requested': len(user_ids),
@@ -490,14 +561,14 @@ class UserManager:
     ) -> List[Dict[str, Any]]:
         """Retrieve users with pagination and optional search filtering.
         
-        Note: Search functionality is limited due to PostgresDB CRUD limitations.
-        For complex queries, consider using direct SQLAlchemy queries.
+        Filtering and pagination both run in the database, so only the
+        requested page of users is fetched.
         
         Args:
             limit: Maximum number of users to return (default: 100)
             offset: Number of users to skip (default: 0)
-            search: Search term for filtering by username, first_name, or 
-                    last_name
+            search: Case-insensitive search term matched against username,
+                    first_name, or last_name
             join: Join control parameter:
                 - 0 (default): No joins, return only user data
                 - 1: Forward joins (fetch related data from referenced tables)
@@ -531,51 +602,18 @@ class UserManager:
         """
         try:
             with self._get_db_connection() as db:
-                # Get all users (PostgresDB doesn't support complex filtering)
-                all_users = db.read(USERS_TABLE, join=join)
-                
-                # Convert to list of dictionaries
-                users_list = [dict(user._mapping) for user in all_users]
-                
-                # Apply search filter manually if provided
                 if search:
-                    users_list = self._filter_users_by_search(users_list, search)
-                
-                # Apply pagination manually
-                start_index = offset
-                end_index = offset + limit
-                return users_list[start_index:end_index]
+                    users = db.search(USERS_TABLE, search, USER_SEARCH_FIELDS, limit=limit, offset=offset)
+                elif join:
+                    users = [user._mapping for user in db.read(USERS_TABLE, join=join, limit=limit, offset=offset)]
+                else:
+                    users = db.read_mappings(USERS_TABLE, limit=limit, offset=offset)
+                # Plain dicts only for the returned page
+                return [dict(user) for user in users]
                 
         except SQLAlchemyError as exc:
             raise UserNotFoundError(str(exc)) from exc
 
-    def _filter_users_by_search(self, users_list: List[Dict[str, Any]], search: str) -> List[Dict[str, Any]]:
-        """Filter users by search term (internal helper method).
-        
-        Args:
-            users_list: List of user dictionaries to filter
-            search: Search term to match against username, first_name, last_name
-            
-        Returns:
-            Filtered list of user dictionaries
-        """
-        search_lower = search.lower()
-        filtered_users = []
-        
-        for user in users_list:
-            username = user.get('username', '').lower()
-            first_name = user.get('first_name', '').lower() if user.get('first_name') else ''
-            last_name = user.get('last_name', '').lower() if user.get('last_name') else ''
-            name = user.get('name', '').lower() if user.get('name') else ''
-            
-            if (search_lower in username or 
-                search_lower in first_name or 
-                search_lower in last_name or
-                search_lower in name):
-                filtered_users.append(user)
-                
-        return filtered_users
-
     def count_users(self, search: Optional[str] = None) -> int:
         """Count the total number of users, optionally filtered by search term.
         
@@ -596,22 +634,20 @@ class UserManager:
         """
         try:
             with self._get_db_connection() as db:
-                all_users = db.read(USERS_TABLE)
-                users_list = [dict(user._mapping) for user in all_users]
-                
                 if search:
-                    users_list = self._filter_users_by_search(users_list, search)
-                    
-                return len(users_list)
+                    return db.count_search(USERS_TABLE, search, USER_SEARCH_FIELDS)
+                return db.count(USERS_TABLE)
                 
         except SQLAlchemyError as exc:
             raise UserNotFoundError(str(exc)) from exc
 
-    def user_exists(self, user_id: int) -> bool:
+    def user_exists(self, user_id: int, cache: bool = True) -> bool:
         """Check if a user exists by their ID.
         
         Args:
             user_id: The unique identifier of the user
+            cache: Whether a cached lookup may answer the check; pass False
+                   for a fresh read
             
         Returns:
             True if user exists, False otherwise
@@ -624,18 +660,29 @@ class UserManager:
             ...     print("User not found")
         """
         self._validate_user_id(user_id)
+        if cache and _user_cache.has(_id_cache_key(user_id)):
+            return True
         try:
             with self._get_db_connection() as db:
                 users = db.read(USERS_TABLE, {'id': user_id})
-                return len(users) > 0
+                if not users:
+                    return False
+                if cache:
+                    _user_cache.set(_id_cache_key(user_id), dict(users[0]._mapping))
+                return True
         except SQLAlchemyError:
             return False
 
-    def email_exists(self, email: str) -> bool:
+    def email_exists(self, email: str, cache: bool = True) -> bool:
         """Check if a user exists with the given email address.
         
+        The email is trimmed and lowercased, matching how usernames are
+        stored, so the check is case-insensitive and uses the username index.
+        
         Args:
             email: The email address to check
+            cache: Whether a cached lookup may answer the check; pass False
+                   for a fresh read
             
         Returns:
             True if email exists, False otherwise
@@ -649,11 +696,18 @@ class UserManager:
         """
         if not email or not isinstance(email, str):
             raise ValueError("Email must be a non-empty string")
-            
+        email = _canonical_email(email)
+        
+        if cache and _user_cache.has(_email_cache_key(email)):
+            return True
         try:
             with self._get_db_connection() as db:
-                users = db.read(USERS_TABLE, {'email': email})
-                return len(users) > 0
+                users = db.read(USERS_TABLE, {'username': email})
+                if not users:
+                    return False
+                if cache:
+                    _user_cache.set(_email_cache_key(email), dict(users[0]._mapping))
+                return True
         except SQLAlchemyError:
             return False
 
@@ -680,29 +734,29 @@ class UserManager:
         try:
             with self._get_db_connection() as db:
                 db.truncate_and_reset_identity(USERS_TABLE)
+            _user_cache.clear()
         except SQLAlchemyError as exc:
             raise UserDeleteError(str(exc)) from exc
 
     def close(self) -> None:
-        """Close the database connection if using persistent connection.
+        """Release this manager's reference to the shared database instance.
         
-        This method should be called when finished with the UserManager
-        if using persistent_connection=True, or when explicitly needed.
+        Connections are returned to the engine pool after every operation, so
+        there is nothing to close here; the shared PostgresDB instance is
+        deliberately left open for other callers. Use close_global_connection()
+        at application shutdown to dispose the pool.
         
         Example:
             >>> user_manager = UserManager(persistent_connection=True)
             >>> # ... perform operations ...
-            >>> user_manager.close()  # Clean up resources
+            >>> user_manager.close()
         """
-        if self._db_connection:
-            self._db_connection.close()
-            self._db_connection = None
+        self._db_connection = None
 
     def __enter__(self) -> 'UserManager':
         """Context manager entry."""
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
-        """Context manager exit - automatically close connection if needed."""
-        if self._auto_close or self._persistent_connection:
-            self.close()
+        """Context manager exit."""
+        self.close()
@@ -38,6 +38,13 @@ DEFAULT_USER_ACTIVE_STATUS = True
 # Database table names
 USERS_TABLE = "users"
 
+# Columns matched by free-text user search
+USER_SEARCH_FIELDS = ("username", "first_name", "last_name")
+
+# User lookup cache settings
+USER_CACHE_THRESHOLD = 4096  # Maximum cached lookups before entries are pruned
+USER_CACHE_TIMEOUT = 30  # Seconds a cached lookup stays valid
+
 # User operation error messages
 USER_ALREADY_EXISTS = "A user with this email already exists"
 USER_NOT_FOUND = "User not found"
@@ -5,19 +5,19 @@ including error messages, table names, and permission types.
 """
 
 # Error messages
-USER_PERMISSION_ALREADY_EXISTS: str = "User permission with this combination already exists."
-USER_PERMISSION_NOT_FOUND: str = "User permission not found."
-INVALID_PERMISSION_TYPE: str = "Invalid permission type."
-USER_NOT_FOUND_FOR_PERMISSION: str = "User not found for permission assignment."
-RESOURCE_NOT_FOUND: str = "Resource not found for permission assignment."
+USER_PERMISSION_ALREADY_EXISTS = "User permission with this combination already exists."
+USER_PERMISSION_NOT_FOUND = "User permission not found."
+INVALID_PERMISSION_TYPE = "Invalid permission type."
+USER_NOT_FOUND_FOR_PERMISSION = "User not found for permission assignment."
+RESOURCE_NOT_FOUND = "Resource not found for permission assignment."
 
 # Table names
-USER_PERMISSIONS_TABLE: str = "user_permissions"
-USERS_TABLE: str = "users"
-RESOURCES_TABLE: str = "resources"
+USER_PERMISSIONS_TABLE = "user_permissions"
+USERS_TABLE = "users"
+RESOURCES_TABLE = "resources"
 
 # Permission types
-PERMISSION_TYPES = ["read", "write", "delete", "admin", "execute", "view", "edit", "create"]
+PERMISSION_TYPES = ("read", "write", "delete", "admin", "execute", "view", "edit", "create")
 
 # Permission levels
 PERMISSION_LEVELS = {
@@ -28,6 +28,6 @@ PERMISSION_LEVELS = {
 }
 
 # Default permission settings
-DEFAULT_PERMISSION_LEVEL: int = 1
-DEFAULT_PERMISSION_TYPE: str = "read"
-DEFAULT_IS_ACTIVE: bool = True
+DEFAULT_PERMISSION_LEVEL = 1
+DEFAULT_PERMISSION_TYPE = "read"
+DEFAULT_IS_ACTIVE = True
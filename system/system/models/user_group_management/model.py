@@ -5,7 +5,7 @@ including group creation, updates, and status management.
 """
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, UniqueConstraint
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -169,9 +169,14 @@ class UserGroupMapper(Base):
         user_id: Foreign key reference to User.id
         created_on: Timestamp when the mapping was created
         is_active: Boolean flag for mapping status (default: True)
+    
+    A user can be mapped to a given group only once.
     """
     
     __tablename__ = 'user_group_mapper'
+    __table_args__ = (
+        UniqueConstraint('user_id', 'group_id', name='uq_user_group_mapper_user_id_group_id'),
+    )
     
     # Primary key
     id = Column(Integer, primary_key=True, autoincrement=True, index=True)